@@ -0,0 +1,66 @@
+"""
+CORS origin checks against a large allow-list, with the OriginMatcher
+compared to trying one compiled pattern per origin in turn.
+
+    python benchmarks/cors_origins.py
+"""
+
+from __future__ import annotations
+
+import re
+
+from timeit import repeat
+
+from sanic_ext.extensions.http.cors import OriginMatcher
+
+
+LITERALS = 900
+PATTERNS = 20
+NUMBER = 10_000
+
+
+def allow_list() -> list:
+    return [f"https://site-{i}.example.com" for i in range(LITERALS)] + [
+        re.compile(rf"https://[a-z]+\.tenant-{i}\.example\.org$")
+        for i in range(PATTERNS)
+    ]
+
+
+def loop_matcher(origins):
+    # Every origin compiled to a pattern and tried in turn
+    patterns = tuple(
+        origin
+        if isinstance(origin, re.Pattern)
+        else re.compile(re.escape(origin) + "$")
+        for origin in origins
+    )
+
+    def match(origin: str) -> bool:
+        return any(pattern.match(origin) for pattern in patterns)
+
+    return match
+
+
+def main() -> None:
+    origins = allow_list()
+    checks = {
+        "literal hit (last)": f"https://site-{LITERALS - 1}.example.com",
+        "pattern hit": f"https://api.tenant-{PATTERNS - 1}.example.org",
+        "miss": "https://unknown.example.net",
+    }
+    matchers = {
+        "loop": loop_matcher(origins),
+        "matcher": OriginMatcher(origins).match,
+        "uncached": OriginMatcher(origins, cache_size=0).match,
+    }
+    for label, origin in checks.items():
+        results = []
+        for name, match in matchers.items():
+            assert match(origin) is (label != "miss")
+            best = min(repeat(lambda: match(origin), number=NUMBER, repeat=5))
+            results.append(f"{name} {best / NUMBER * 1e6:8.2f}us")
+        print(f"{label:<20}", "  ".join(results))
+
+
+if __name__ == "__main__":
+    main()
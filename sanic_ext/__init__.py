@@ -4,6 +4,7 @@ from sanic_ext.bootstrap import Extend
 from sanic_ext.config import Config
 from sanic_ext.extensions.base import Extension
 from sanic_ext.extensions.http.cors import cors
+from sanic_ext.extensions.http.head import head_metadata
 from sanic_ext.extensions.openapi import openapi
 from sanic_ext.extensions.templating.render import render
 from sanic_ext.extras.request import CountedRequest
@@ -19,6 +20,7 @@ __all__ = [
     "Extend",
     "Extension",
     "cors",
+    "head_metadata",
     "openapi",
     "render",
     "serializer",
@@ -17,6 +17,7 @@ from sanic_ext.config import Config, add_fallback_config
 from sanic_ext.extensions.base import Extension
 from sanic_ext.extensions.health.extension import HealthExtension
 from sanic_ext.extensions.http.extension import HTTPExtension
+from sanic_ext.extensions.injection.constructor import Scope
 from sanic_ext.extensions.injection.extension import InjectionExtension
 from sanic_ext.extensions.injection.registry import (
     ConstantRegistry,
@@ -153,6 +154,8 @@ class Extend:
         type: type,
         constructor: Optional[Callable[..., Any]] = None,
         request_arg: Optional[str] = None,
+        concurrent: bool = False,
+        scope: Union[str, Scope] = Scope.TRANSIENT,
     ) -> None:
         """
         Add a dependency for injection
@@ -160,7 +163,9 @@ class Extend:
         :param type: The type of the dependency
         :type type: Type
         :param constructor: A callable that will return an instance to be
-            injected, when ``False`` it will call the type, defaults to None
+            injected, when ``False`` it will call the type. An async
+            generator or ``asynccontextmanager`` function may be used to
+            release the instance once its scope ends, defaults to None
         :type constructor: Optional[Callable[..., Any]], optional
         :param request_arg: Explicitly state which argument in the
             constructor (if any) should be a ``Request`` object, when set to
@@ -170,12 +175,28 @@ class Extend:
             otherwise better to use a properly type annotated constructor,
             defaults to None
         :type request_arg: Optional[str], optional
+        :param concurrent: Allow the constructor to run concurrently with
+            the concurrent dependencies declared next to it on the same
+            handler or constructor. If one of them fails, the others are
+            cancelled. Leave this off for constructors with side effects
+            that must run in order, defaults to False
+        :type concurrent: bool, optional
+        :param scope: How long a constructed instance is reused: a new one
+            for every injection (``"transient"``), one per request
+            (``"request"``), one per worker process built on first use
+            (``"worker"``), or one per worker process built at startup
+            (``"app"``), defaults to ``"transient"``
+        :type scope: Union[str, Scope], optional
         :raises SanicException: _description_
         """
         if not self._injection_registry:
             raise SanicException("Injection extension not enabled")
         self._injection_registry.register(
-            type, constructor, request_arg=request_arg
+            type,
+            constructor,
+            request_arg=request_arg,
+            concurrent=concurrent,
+            scope=scope,
         )
 
     def add_constant(self, name: str, value: Any, overwrite: bool = False):
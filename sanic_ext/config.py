@@ -30,7 +30,9 @@ class Config(SanicConfig):
         cors_vary_header: bool = True,
         health: bool = False,
         health_endpoint: bool = False,
+        health_max_loop_lag: float = 0,
         health_max_misses: int = 3,
+        health_max_rss: int = 0,
         health_missed_threshhold: int = 10,
         health_monitor: bool = True,
         health_report_interval: int = 5,
@@ -44,6 +46,14 @@ class Config(SanicConfig):
         injection_priority: int = PRIORITY,
         injection_load_custom_constants: bool = False,
         logging: bool = False,
+        logging_batch_size: int = 64,
+        logging_flush_interval: float = 0.05,
+        logging_overflow: str = "emit",
+        logging_overflow_keep_level: Union[int, str] = "WARNING",
+        logging_overflow_report_interval: float = 10,
+        logging_overflow_sample_rate: float = 0.1,
+        logging_overflow_sample_rates: Optional[dict[str, float]] = None,
+        logging_preformat: str = "",
         logging_queue_max_size: int = 4096,
         loggers: list[str] = [
             "sanic.access",
@@ -80,7 +90,9 @@ class Config(SanicConfig):
             str, os.PathLike, Sequence[Union[str, os.PathLike]]
         ] = "templates",
         templating_enable_async: bool = True,
+        templating_bytecode_cache: Union[bool, str, os.PathLike, None] = None,
         trace_excluded_headers: Sequence[str] = ("authorization", "cookie"),
+        trace_max_size: int = 65_536,
         **kwargs,
     ):
         self.CORS = cors
@@ -96,7 +108,9 @@ class Config(SanicConfig):
         self.CORS_VARY_HEADER = cors_vary_header
         self.HEALTH = health
         self.HEALTH_ENDPOINT = health_endpoint
+        self.HEALTH_MAX_LOOP_LAG = health_max_loop_lag
         self.HEALTH_MAX_MISSES = health_max_misses
+        self.HEALTH_MAX_RSS = health_max_rss
         self.HEALTH_MISSED_THRESHHOLD = health_missed_threshhold
         self.HEALTH_MONITOR = health_monitor
         self.HEALTH_REPORT_INTERVAL = health_report_interval
@@ -110,6 +124,16 @@ class Config(SanicConfig):
         self.INJECTION_PRIORITY = injection_priority
         self.INJECTION_LOAD_CUSTOM_CONSTANTS = injection_load_custom_constants
         self.LOGGING = logging
+        self.LOGGING_BATCH_SIZE = logging_batch_size
+        self.LOGGING_FLUSH_INTERVAL = logging_flush_interval
+        self.LOGGING_OVERFLOW = logging_overflow
+        self.LOGGING_OVERFLOW_KEEP_LEVEL = logging_overflow_keep_level
+        self.LOGGING_OVERFLOW_REPORT_INTERVAL = (
+            logging_overflow_report_interval
+        )
+        self.LOGGING_OVERFLOW_SAMPLE_RATE = logging_overflow_sample_rate
+        self.LOGGING_OVERFLOW_SAMPLE_RATES = logging_overflow_sample_rates
+        self.LOGGING_PREFORMAT = logging_preformat
         self.LOGGING_QUEUE_MAX_SIZE = logging_queue_max_size
         self.LOGGERS = loggers
         self.OAS = oas
@@ -142,7 +166,9 @@ class Config(SanicConfig):
         }
         self.TEMPLATING_PATH_TO_TEMPLATES = templating_path_to_templates
         self.TEMPLATING_ENABLE_ASYNC = templating_enable_async
+        self.TEMPLATING_BYTECODE_CACHE = templating_bytecode_cache
         self.TRACE_EXCLUDED_HEADERS = trace_excluded_headers
+        self.TRACE_MAX_SIZE = trace_max_size
 
         if isinstance(self.TRACE_EXCLUDED_HEADERS, str):
             self.TRACE_EXCLUDED_HEADERS = tuple(
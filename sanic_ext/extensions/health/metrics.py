@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import os
+
+from time import monotonic
+from weakref import WeakSet
+
+from sanic import Request
+
+
+try:
+    import resource
+
+    RESOURCE = True
+except ImportError:  # no cov
+    RESOURCE = False
+
+
+FIELDS = (
+    "timestamp",
+    "loop_lag",
+    "rss",
+    "open_fds",
+    "in_flight",
+    "requests_per_second",
+)
+
+
+def rss() -> int:
+    """The resident memory of the current process in bytes, or 0."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        ...
+    if RESOURCE:  # no cov
+        # Only the peak is available here, which is in kilobytes on Linux
+        # and in bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if os.uname().sysname == "Darwin" else peak * 1024
+    return 0  # no cov
+
+
+def open_fds() -> int:
+    """The number of open file descriptors of the current process, or 0."""
+    for path in ("/proc/self/fd", "/dev/fd"):
+        try:
+            return len(os.listdir(path))
+        except OSError:
+            ...
+    return 0  # no cov
+
+
+class WorkerMetrics:
+    """
+    The load of a worker process between two health reports. In flight
+    requests are tracked weakly, so that a request that never gets a
+    response, such as one whose connection dropped, is not counted forever.
+    """
+
+    __slots__ = ("_in_flight", "_loop_lag", "_requests", "_since")
+
+    def __init__(self) -> None:
+        self._in_flight: WeakSet[Request] = WeakSet()
+        self._loop_lag = 0.0
+        self._requests = 0
+        self._since = monotonic()
+
+    def request(self, request: Request) -> None:
+        self._requests += 1
+        self._in_flight.add(request)
+
+    def response(self, request: Request) -> None:
+        self._in_flight.discard(request)
+
+    def lag(self, lag: float) -> None:
+        if lag > self._loop_lag:
+            self._loop_lag = lag
+
+    def collect(self, timestamp: float) -> tuple[float, ...]:
+        """
+        A report in the order of ``FIELDS``. The loop lag is the worst one
+        since the last report, and the request rate is averaged over the
+        same period.
+        """
+        now = monotonic()
+        elapsed = now - self._since
+        report = (
+            timestamp,
+            self._loop_lag,
+            float(rss()),
+            float(open_fds()),
+            float(len(self._in_flight)),
+            self._requests / elapsed if elapsed > 0 else 0.0,
+        )
+        self._loop_lag = 0.0
+        self._requests = 0
+        self._since = now
+        return report
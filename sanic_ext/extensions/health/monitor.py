@@ -1,16 +1,20 @@
 from __future__ import annotations
 
-from asyncio import sleep
-from dataclasses import dataclass
+from asyncio import get_running_loop, sleep
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from multiprocessing import Manager
-from queue import Empty, Full
+from multiprocessing import Array, RawArray
 from signal import SIGINT, SIGTERM
 from signal import signal as signal_func
-from typing import TYPE_CHECKING, Optional
+from time import sleep as sleep_sync
+from typing import TYPE_CHECKING, Any, Optional
 
 from sanic.application.constants import ServerStage
 from sanic.log import logger
+from sanic.signals import Event
+
+from .metrics import FIELDS, WorkerMetrics
 
 
 if TYPE_CHECKING:
@@ -25,13 +29,45 @@ class HealthState:
     name: str
     last: Optional[datetime] = None
     misses: int = 0
-
-    def report(self, timestamp: int) -> None:
+    beat: float = 0.0
+    metrics: dict[str, float] = field(default_factory=dict)
+    slot: Optional[int] = None
+    # The generation of the slot when a restart was requested, until a new
+    # process claims the slot
+    pending: Optional[int] = None
+
+    def report(self, timestamp: float, *metrics: float) -> None:
         logger.debug(f"Reporting {self.name}")
         if self.misses:
             logger.info(f"Recovered {self.name}")
+        self.beat = timestamp
         self.last = datetime.fromtimestamp(timestamp)
         self.misses = 0
+        self.metrics = dict(zip(FIELDS[1:], metrics))
+        self.check_limits()
+
+    def check_limits(self) -> None:
+        """
+        Catch a worker that is still reporting, but whose event loop is
+        stalling or whose memory keeps growing.
+        """
+        loop_lag = self.metrics.get("loop_lag", 0.0)
+        if (
+            HealthMonitor.MAX_LOOP_LAG
+            and loop_lag > HealthMonitor.MAX_LOOP_LAG
+        ):
+            logger.warning(
+                f"Event loop of {self.name} lagged by {loop_lag:.3f}s "
+                f"(limit {HealthMonitor.MAX_LOOP_LAG}s)"
+            )
+            raise Stale
+        rss = self.metrics.get("rss", 0.0)
+        if HealthMonitor.MAX_RSS and rss > HealthMonitor.MAX_RSS:
+            logger.warning(
+                f"Memory of {self.name} reached {rss:.0f} bytes "
+                f"(limit {HealthMonitor.MAX_RSS} bytes)"
+            )
+            raise Stale
 
     def missed(self) -> None:
         self.misses += 1
@@ -42,39 +78,137 @@ class HealthState:
         if self.misses >= HealthMonitor.MAX_MISSES:
             raise Stale
 
-    def check(self) -> None:
+    def check(self, now: Optional[datetime] = None) -> None:
         if not self.last:
             return
 
         threshhold = timedelta(
             seconds=(HealthMonitor.MISSED_THRESHHOLD * (self.misses + 1))
         )
-        if self.last < (datetime.now() - threshhold):
+        if self.last < ((now or datetime.now()) - threshhold):
             self.missed()
 
     def reset(self) -> None:
         self.misses = 0
         self.last = datetime.now()
+        self.metrics = {}
+
+
+class HeartbeatTable:
+    """
+    Worker heartbeats kept in shared memory. Every worker process claims a
+    slot under its name, and then reports by writing a timestamp and its
+    metrics (see ``FIELDS``) into that slot, which needs neither a lock nor
+    a round trip to another process. Each claim also bumps the generation
+    of the slot, which tells a restarted process apart from the old one.
+    """
+
+    NAME_SIZE = 64
+
+    def __init__(self, names: Any, beats: Any, generations: Any):
+        self.names = names
+        self.beats = beats
+        self.generations = generations
 
+    @classmethod
+    def create(cls, slots: int) -> HeartbeatTable:
+        return cls(
+            Array("c", slots * cls.NAME_SIZE),
+            RawArray("d", slots * len(FIELDS)),
+            RawArray("i", slots),
+        )
 
-def send_healthy(name, queue):
-    health = (name, datetime.now().timestamp())
-    logger.debug(f"Sending health: {health}", extra={"verbosity": 1})
-    try:
-        queue.put_nowait(health)
-    except Full:
-        ...
+    def __len__(self) -> int:
+        return len(self.beats) // len(FIELDS)
+
+    @classmethod
+    def truncate(cls, name: str) -> str:
+        """The name of a worker process as it is stored in its slot."""
+        return name.encode()[: cls.NAME_SIZE].decode(errors="ignore")
+
+    def name(self, slot: int) -> str:
+        start = slot * self.NAME_SIZE
+        raw = self.names[start : start + self.NAME_SIZE]
+        return raw.rstrip(b"\0").decode()
+
+    def claim(self, name: str) -> Optional[int]:
+        """
+        The slot of a worker process. A restarted process keeps its name,
+        and so it gets back the slot that it had before.
+        """
+        name = self.truncate(name)
+        encoded = name.encode()
+        with self.names.get_lock():
+            free = None
+            for slot in range(len(self)):
+                current = self.name(slot)
+                if current == name:
+                    self.generations[slot] += 1
+                    return slot
+                if not current and free is None:
+                    free = slot
+            if free is not None:
+                start = free * self.NAME_SIZE
+                self.names[start : start + self.NAME_SIZE] = encoded.ljust(
+                    self.NAME_SIZE, b"\0"
+                )
+                self.generations[free] += 1
+            return free
+
+    def generation(self, slot: int) -> int:
+        return self.generations[slot]
+
+    def beat(self, slot: int, report: Sequence[float]) -> None:
+        start = slot * len(FIELDS)
+        # The timestamp goes last, so that the monitor does not pick up a
+        # new heartbeat before its metrics have been written
+        self.beats[start + 1 : start + len(FIELDS)] = report[1:]
+        self.beats[start] = report[0]
+
+    def reports(self):
+        beats = self.beats[:]
+        size = len(FIELDS)
+        for slot in range(len(self)):
+            yield slot, beats[slot * size : (slot + 1) * size]
+
+
+def send_healthy(name, slot, table, metrics):
+    report = metrics.collect(datetime.now().timestamp())
+    logger.debug(f"Sending health: {(name, report)}", extra={"verbosity": 1})
+    table.beat(slot, report)
+    return report
 
 
 async def health_check(app: Sanic):
+    table = HeartbeatTable(
+        app.shared_ctx.health_names,
+        app.shared_ctx.health_beats,
+        app.shared_ctx.health_generations,
+    )
+    slot = table.claim(app.m.name)
+    if slot is None:
+        logger.warning(
+            f"No health check slot is left for {app.m.name}, "
+            "it will not be monitored"
+        )
+        return
+
+    metrics: WorkerMetrics = app.ctx._health_metrics
+    loop = get_running_loop()
     sent = datetime.now()
 
     while app.state.stage is ServerStage.SERVING:
         now = datetime.now()
         if sent < now - timedelta(seconds=HealthMonitor.REPORT_INTERVAL):
-            send_healthy(app.m.name, app.shared_ctx.health_queue)
+            report = send_healthy(app.m.name, slot, table, metrics)
+            if app.config.HEALTH_ENDPOINT:
+                app.m.state.update({"metrics": dict(zip(FIELDS, report))})
             sent = now
+        # How late the loop is to wake up from this sleep is how long any
+        # other callback would have been kept waiting
+        start = loop.time()
         await sleep(0.1)
+        metrics.lag(loop.time() - start - 0.1)
 
 
 async def start_health_check(app: Sanic):
@@ -95,7 +229,9 @@ async def setup_health_monitor(app, *_):
         health,
         {
             "process_names": process_names,
-            "health_queue": app.shared_ctx.health_queue,
+            "health_names": app.shared_ctx.health_names,
+            "health_beats": app.shared_ctx.health_beats,
+            "health_generations": app.shared_ctx.health_generations,
         },
     )
 
@@ -104,43 +240,94 @@ class HealthMonitor:
     MAX_MISSES = 3
     REPORT_INTERVAL = 5
     MISSED_THRESHHOLD = 10
+    SCAN_INTERVAL = 1
+    MAX_LOOP_LAG = 0.0
+    MAX_RSS = 0
 
     def __init__(self, app: Sanic):
         self.run = True
         self.monitor_publisher = app.manager.monitor_publisher
 
-    def __call__(self, process_names, health_queue) -> None:
+    def __call__(
+        self, process_names, health_names, health_beats, health_generations
+    ) -> None:
         signal_func(SIGINT, self.stop)
         signal_func(SIGTERM, self.stop)
 
+        table = HeartbeatTable(health_names, health_beats, health_generations)
+        self.watch(process_names)
+        while self.run:
+            self.scan(table)
+            sleep_sync(self.SCAN_INTERVAL)
+
+    def watch(self, process_names: Sequence[str]) -> None:
         now = datetime.now()
-        health_state = {
+        self.health_state = {
             process_name: HealthState(last=now, name=process_name)
             for process_name in process_names
         }
-        while self.run:
-            try:
-                name, timestamp = health_queue.get(timeout=0.05)
-            except Empty:
-                ...
-            else:
-                health_state[name].report(timestamp)
-
-            for state in health_state.values():
+        # Slots only hold as much of a name as fits
+        self.process_names = {
+            HeartbeatTable.truncate(process_name): process_name
+            for process_name in process_names
+        }
+        self.slots: dict[int, HealthState] = {}
+
+    def scan(self, table: HeartbeatTable) -> None:
+        for slot, report in table.reports():
+            timestamp = report[0]
+            if not timestamp:
+                continue
+            if (state := self.slots.get(slot)) is None:
+                # A slot is claimed before the first heartbeat, and keeps
+                # its name from then on
+                name = table.name(slot)
+                name = self.process_names.get(name, name)
+                state = self.health_state.setdefault(
+                    name, HealthState(name=name)
+                )
+                state.slot = slot
+                self.slots[slot] = state
+            if (
+                state.pending is not None
+                and table.generation(slot) != state.pending
+            ):
+                logger.info(f"Restarted {state.name}")
+                state.pending = None
+            if timestamp > state.beat:
                 try:
-                    state.check()
+                    state.report(*report)
                 except Stale:
-                    state.reset()
-                    self.monitor_publisher.send(state.name)
+                    self.restart(state, table)
+
+        now = datetime.now()
+        for state in self.health_state.values():
+            try:
+                state.check(now)
+            except Stale:
+                self.restart(state, table)
+
+    def restart(self, state: HealthState, table: HeartbeatTable) -> None:
+        # The old process may keep reporting until it has been replaced,
+        # so only ask for a restart once
+        if state.pending is not None:
+            return
+        state.pending = (
+            0 if state.slot is None else table.generation(state.slot)
+        )
+        state.reset()
+        self.monitor_publisher.send(state.name)
 
     def stop(self, *_):
         self.run = False
 
     @classmethod
     def prepare(cls, app: Sanic):
-        sync_manager = Manager()
-        health_queue = sync_manager.Queue(maxsize=app.state.workers * 2)
-        app.shared_ctx.health_queue = health_queue
+        # Leave room for workers that are added after startup
+        table = HeartbeatTable.create(app.state.workers * 2)
+        app.shared_ctx.health_names = table.names
+        app.shared_ctx.health_beats = table.beats
+        app.shared_ctx.health_generations = table.generations
 
     @classmethod
     def setup(
@@ -149,6 +336,8 @@ class HealthMonitor:
         max_misses: Optional[int] = None,
         report_interval: Optional[int] = None,
         missed_threshhold: Optional[int] = None,
+        max_loop_lag: Optional[float] = None,
+        max_rss: Optional[int] = None,
     ):
         HealthMonitor.MAX_MISSES = max_misses or app.config.HEALTH_MAX_MISSES
         HealthMonitor.REPORT_INTERVAL = (
@@ -157,6 +346,20 @@ class HealthMonitor:
         HealthMonitor.MISSED_THRESHHOLD = (
             missed_threshhold or app.config.HEALTH_MISSED_THRESHHOLD
         )
+        HealthMonitor.MAX_LOOP_LAG = (
+            max_loop_lag or app.config.HEALTH_MAX_LOOP_LAG
+        )
+        HealthMonitor.MAX_RSS = max_rss or app.config.HEALTH_MAX_RSS
+        app.ctx._health_metrics = metrics = WorkerMetrics()
+
+        @app.signal(Event.HTTP_LIFECYCLE_REQUEST)
+        async def count_request(request, **_):
+            metrics.request(request)
+
+        @app.signal(Event.HTTP_LIFECYCLE_RESPONSE)
+        async def count_response(request, **_):
+            metrics.response(request)
+
         app.main_process_start(prepare_health_monitor)
         app.main_process_ready(setup_health_monitor)
         app.after_server_start(start_health_check)
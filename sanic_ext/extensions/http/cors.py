@@ -1,7 +1,10 @@
 import re
 
+from collections import defaultdict, deque
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from datetime import timedelta
+from functools import lru_cache
 from types import SimpleNamespace
 from typing import Any, Optional, Union
 
@@ -9,6 +12,9 @@ from sanic import HTTPResponse, Request, Sanic
 from sanic.exceptions import SanicException
 from sanic.helpers import Default, _default
 from sanic.log import logger
+from sanic.middleware import Middleware, MiddlewareLocation
+from sanic.response import empty
+from sanic_routing import Route
 
 from sanic_ext.config import PRIORITY
 
@@ -23,13 +29,16 @@ REQUEST_METHOD_HEADER = "access-control-request-method"
 REQUEST_HEADERS_HEADER = "access-control-request-headers"
 MAX_AGE_HEADER = "access-control-max-age"
 VARY_HEADER = "vary"
+ORIGIN_CACHE_SIZE = 1024
+
+Origin = Union[str, re.Pattern]
 
 
 @dataclass(frozen=True)
 class CORSSettings:
     allow_headers: frozenset[str]
     allow_methods: frozenset[str]
-    allow_origins: tuple[re.Pattern, ...]
+    allow_origins: tuple[Origin, ...]
     always_send: bool
     automatic_options: bool
     expose_headers: frozenset[str]
@@ -38,6 +47,57 @@ class CORSSettings:
     supports_credentials: bool
 
 
+HeaderBlock = tuple[tuple[str, str], ...]
+
+
+class OriginMatcher:
+    """
+    Decides whether a request origin is allowed. Literal origins are looked
+    up in a set. All of the patterns are tried at once as an alternation,
+    and the outcome is remembered for recently seen origins.
+    """
+
+    __slots__ = ("literals", "patterns", "_match_all", "_match_pattern")
+
+    def __init__(
+        self,
+        origins: Iterable[Origin],
+        cache_size: int = ORIGIN_CACHE_SIZE,
+    ) -> None:
+        origins = tuple(origins)
+        self.literals = frozenset(o for o in origins if isinstance(o, str))
+        self.patterns = tuple(o for o in origins if isinstance(o, re.Pattern))
+        self._match_all = WILDCARD_PATTERN in self.patterns
+        combined = _combine_patterns(self.patterns)
+
+        def match_pattern(origin: str) -> bool:
+            return any(pattern.match(origin) for pattern in combined)
+
+        self._match_pattern = lru_cache(maxsize=cache_size)(match_pattern)
+
+    def match(self, origin: str) -> bool:
+        if self._match_all or origin in self.literals:
+            return True
+        return bool(self.patterns) and self._match_pattern(origin)
+
+
+@dataclass(frozen=True)
+class RouteCORSSettings:
+    """
+    The CORS settings of a route group, resolved once at startup. Values
+    that depend upon whether a request carries credentials are stored as
+    pairs that are indexed by that flag.
+    """
+
+    origins: OriginMatcher
+    default_origin: str
+    send_wildcard: bool
+    headers: tuple[HeaderBlock, HeaderBlock]
+    preflight_headers: tuple[HeaderBlock, HeaderBlock]
+    allow_headers: tuple[frozenset[str], frozenset[str]]
+    credentials_vary: bool
+
+
 def add_cors(app: Sanic) -> None:
     _setup_cors_settings(app)
 
@@ -55,19 +115,30 @@ def add_cors(app: Sanic) -> None:
             )
             return
 
-        _add_origin_header(request, response)
+        route = request.route
+        settings: RouteCORSSettings = (
+            route and getattr(route.ctx, "_cors", None)
+        ) or request.app.ctx._cors
+        headers = response.headers
 
-        if ORIGIN_HEADER not in response.headers:
+        if origin := _get_origin(request, settings):
+            headers[ORIGIN_HEADER] = origin
+        elif ORIGIN_HEADER not in headers:
             return
 
-        _add_expose_header(request, response)
-        _add_credentials_header(request, response)
-        _add_vary_header(request, response)
+        with_credentials = (
+            settings.credentials_vary and _is_request_with_credentials(request)
+        )
+        for key, value in settings.headers[with_credentials]:
+            headers[key] = value
+        if headers.get(ORIGIN_HEADER) != "*":
+            headers[VARY_HEADER] = "origin"
 
         if preflight:
-            _add_max_age_header(request, response)
-            _add_allow_header(request, response)
-            _add_methods_header(request, response)
+            for key, value in settings.preflight_headers[with_credentials]:
+                headers[key] = value
+            if allow_headers := settings.allow_headers[with_credentials]:
+                _add_allow_header(request, response, allow_headers)
 
     @app.before_server_start(priority=PRIORITY)
     async def _assign_cors_settings(app):
@@ -79,8 +150,13 @@ def add_cors(app: Sanic) -> None:
                     for key, value in cors.__dict__.items():
                         setattr(_cors, key, value)
 
+            settings = _make_route_settings(app, _cors, group.methods)
             for route in group:
-                route.ctx._cors = _cors
+                route.ctx._cors = settings
+                if app.ctx.cors.automatic_options and _is_auto_options(route):
+                    _add_preflight_responder(route, group.methods)
+
+        app.ctx._cors = _make_route_settings(app, SimpleNamespace(), None)
 
 
 def cors(
@@ -150,166 +226,198 @@ def _setup_cors_settings(app: Sanic) -> None:
     )
 
 
-def _get_from_cors_ctx(request: Request, key: str, default: Any = None):
-    if request.route:
-        value = getattr(request.route.ctx._cors, key, default)
-        if value is not _default:
-            return value
-    return default
+def _make_route_settings(
+    app: Sanic, route_cors: SimpleNamespace, methods: Optional[Iterable[str]]
+) -> RouteCORSSettings:
+    app_cors: CORSSettings = app.ctx.cors
 
+    def get(key: str, default: Any) -> Any:
+        value = getattr(route_cors, key, _default)
+        return default if value is _default else value
 
-def _add_origin_header(request: Request, response: HTTPResponse) -> None:
-    request_origin = request.headers.get("origin")
-    origin_value = ""
-    allow_origins = _get_from_cors_ctx(
-        request,
-        "_cors_allow_origins",
-        request.app.ctx.cors.allow_origins,
-    )
-    fallback_origin = _get_from_cors_ctx(
-        request,
-        "_cors_origin",
-        request.app.config.CORS_ORIGINS,
+    allow_origins = get("_cors_allow_origins", app_cors.allow_origins)
+    fallback_origin = get("_cors_origin", app.config.CORS_ORIGINS)
+    expose_headers = get("_cors_expose_headers", app_cors.expose_headers)
+    supports_credentials = get(
+        "_cors_supports_credentials", app_cors.supports_credentials
     )
-
-    if request_origin:
-        if request.app.ctx.cors.send_wildcard:
-            origin_value = "*"
-        else:
-            for pattern in allow_origins:
-                if pattern.match(request_origin):
-                    origin_value = request_origin
-                    break
-    elif request.app.ctx.cors.always_send:
+    max_age = get("_cors_max_age", app_cors.max_age)
+    allow_methods = get("_cors_allow_methods", app_cors.allow_methods)
+    allow_headers = get("_cors_allow_headers", app_cors.allow_headers)
+    if isinstance(expose_headers, str):
+        expose_headers = expose_headers.split(",")
+
+    default_origin = ""
+    if app_cors.always_send:
         if WILDCARD_PATTERN in allow_origins:
-            origin_value = "*"
+            default_origin = "*"
+        elif isinstance(fallback_origin, str) and "," not in fallback_origin:
+            default_origin = fallback_origin
         else:
-            if isinstance(fallback_origin, str) and "," not in fallback_origin:
-                origin_value = fallback_origin
-            else:
-                origin_value = request.app.config.get("SERVER_NAME", "")
-
-    if origin_value:
-        response.headers[ORIGIN_HEADER] = origin_value
+            default_origin = app.config.get("SERVER_NAME", "")
+
+    headers: list[HeaderBlock] = []
+    preflight_headers: list[HeaderBlock] = []
+    request_headers: list[frozenset[str]] = []
+    for with_credentials in (False, True):
+        block: list[tuple[str, str]] = []
+        # MDN: The value "*" only counts as a special wildcard value for
+        # requests without credentials (requests without HTTP cookies or
+        # HTTP authentication information). In requests with credentials,
+        # it is treated as the literal header name "*" without special
+        # semantics. Note that the Authorization header can't be wildcarded
+        # and always needs to be listed explicitly.
+        # https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Access-Control-Expose-Headers
+        if not with_credentials and "*" in expose_headers:
+            block.append((EXPOSE_HEADER, "*"))
+        elif expose_headers:
+            block.append((EXPOSE_HEADER, ",".join(expose_headers)))
+        if supports_credentials:
+            block.append((CREDENTIALS_HEADER, "true"))
+        headers.append(tuple(block))
+
+        block = []
+        if max_age:
+            block.append((MAX_AGE_HEADER, max_age))
+        # The same applies to Access-Control-Allow-Headers and
+        # Access-Control-Allow-Methods.
+        # https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Access-Control-Allow-Headers
+        # https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Access-Control-Allow-Methods
+        if not with_credentials and "*" in allow_headers:
+            block.append((ALLOW_HEADERS_HEADER, "*"))
+            request_headers.append(frozenset())
+        else:
+            request_headers.append(frozenset(allow_headers))
+        allowed_methods: Optional[set[str]] = None
+        if not with_credentials and "*" in allow_methods:
+            allowed_methods = {"*"}
+        elif methods is not None:
+            allowed_methods = {method.lower() for method in methods}
+            if allow_methods:
+                allowed_methods &= allow_methods
+        if allowed_methods:
+            block.append(
+                (
+                    ALLOW_METHODS_HEADER,
+                    ",".join(sorted(allowed_methods)).upper(),
+                )
+            )
+        preflight_headers.append(tuple(block))
+
+    return RouteCORSSettings(
+        origins=_get_origin_matcher(allow_origins),
+        default_origin=default_origin,
+        send_wildcard=app_cors.send_wildcard,
+        headers=(headers[0], headers[1]),
+        preflight_headers=(preflight_headers[0], preflight_headers[1]),
+        allow_headers=(request_headers[0], request_headers[1]),
+        credentials_vary=(
+            headers[0] != headers[1]
+            or preflight_headers[0] != preflight_headers[1]
+            or request_headers[0] != request_headers[1]
+        ),
+    )
 
 
-def _add_expose_header(request: Request, response: HTTPResponse) -> None:
-    with_credentials = _is_request_with_credentials(request)
-    headers = None
-    expose_headers = _get_from_cors_ctx(
-        request, "_cors_expose_headers", request.app.ctx.cors.expose_headers
-    )
-    # MDN: The value "*" only counts as a special wildcard value for requests
-    # without credentials (requests without HTTP cookies or HTTP
-    # authentication information). In requests with credentials, it is
-    # treated as the literal header name "*" without special semantics.
-    # Note that the Authorization header can't be wildcarded and always
-    # needs to be listed explicitly.
-    # https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Access-Control-Expose-Headers
-    if not with_credentials and "*" in expose_headers:
-        headers = ["*"]
-    elif expose_headers:
-        headers = expose_headers
-
-    if headers:
-        response.headers[EXPOSE_HEADER] = ",".join(headers)
-
-
-def _add_credentials_header(request: Request, response: HTTPResponse) -> None:
-    supports_credentials = _get_from_cors_ctx(
-        request,
-        "_cors_supports_credentials",
-        request.app.ctx.cors.supports_credentials,
+def _is_auto_options(route: Route) -> bool:
+    return "OPTIONS" in route.methods and getattr(
+        route.handler, "__auto_handler__", False
     )
-    if supports_credentials:
-        response.headers[CREDENTIALS_HEADER] = "true"
 
 
-def _add_allow_header(request: Request, response: HTTPResponse) -> None:
-    with_credentials = _is_request_with_credentials(request)
-    request_headers = {
-        h.strip().lower()
-        for h in request.headers.get(REQUEST_HEADERS_HEADER, "").split(",")
-    }
-    allow_headers = _get_from_cors_ctx(
-        request, "_cors_allow_headers", request.app.ctx.cors.allow_headers
+def _add_preflight_responder(route: Route, methods: Iterable[str]) -> None:
+    """
+    Answer preflight requests to an automatic OPTIONS route before any other
+    request middleware or the handler run. The CORS headers are added by
+    the response hook, the same as for any other response. OPTIONS requests
+    that are not preflights are left to take the usual path.
+    """
+    allow = ",".join(
+        [
+            *sorted(method for method in methods if method != "OPTIONS"),
+            "OPTIONS",
+        ]
     )
 
-    # MDN: The value "*" only counts as a special wildcard value for requests
-    # without credentials (requests without HTTP cookies or HTTP
-    # authentication information). In requests with credentials,
-    # it is treated as the literal header name "*" without special semantics.
-    # Note that the Authorization header can't be wildcarded and always needs
-    # to be listed explicitly.
-    # https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Access-Control-Allow-Headers
-    if not with_credentials and "*" in allow_headers:
-        allow_headers = ["*"]
-    else:
-        allow_headers = request_headers & allow_headers
-
-    if allow_headers:
-        response.headers[ALLOW_HEADERS_HEADER] = ",".join(allow_headers)
-
-
-def _add_max_age_header(request: Request, response: HTTPResponse) -> None:
-    max_age = _get_from_cors_ctx(
-        request, "_cors_max_age", request.app.ctx.cors.max_age
-    )
-    if max_age:
-        response.headers[MAX_AGE_HEADER] = max_age
-
-
-def _add_methods_header(request: Request, response: HTTPResponse) -> None:
-    # MDN: The value "*" only counts as a special wildcard value for requests
-    # without credentials (requests without HTTP cookies or HTTP
-    # authentication information). In requests with credentials, it
-    # is treated as the literal method name "*" without
-    # special semantics.
-    # https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Access-Control-Allow-Methods
-    methods = None
-    with_credentials = _is_request_with_credentials(request)
-    allow_methods = _get_from_cors_ctx(
-        request, "_cors_allow_methods", request.app.ctx.cors.allow_methods
+    def _answer_preflight(request: Request) -> Optional[HTTPResponse]:
+        if request.headers.get(REQUEST_METHOD_HEADER):
+            return empty(headers={"allow": allow})
+        return None
+
+    route.extra.request_middleware = deque(
+        [
+            Middleware(_answer_preflight, MiddlewareLocation.REQUEST),
+            *(getattr(route.extra, "request_middleware", None) or ()),
+        ]
     )
 
-    if not with_credentials and "*" in allow_methods:
-        methods = {"*"}
-    elif request.route:
-        group = request.app.router.groups.get(request.route.segments)
-        if group:
-            group_methods = {method.lower() for method in group.methods}
-            if allow_methods:
-                methods = group_methods & allow_methods
-            else:
-                methods = group_methods
 
-    if methods:
-        response.headers[ALLOW_METHODS_HEADER] = ",".join(methods).upper()
+def _get_origin(request: Request, settings: RouteCORSSettings) -> str:
+    request_origin = request.headers.get("origin")
+    if not request_origin:
+        return settings.default_origin
+    if settings.send_wildcard:
+        return "*"
+    if settings.origins.match(request_origin):
+        return request_origin
+    return ""
 
 
-def _add_vary_header(request: Request, response: HTTPResponse) -> None:
-    # Add Vary: Origin if the Access-Control-Allow-Origin header is not
-    # a wildcard '*'. This is necessary because the response varies based
-    # on the request Origin header when:
-    # 1. Multiple origins are configured
-    # 2. A regex pattern is used that can match multiple origins
-    # 3. Even with a single literal origin, the response varies based on
-    #    whether the Origin header matches (no CORS headers if no match)
-    if response.headers.get(ORIGIN_HEADER) != "*":
-        response.headers[VARY_HEADER] = "origin"
+@lru_cache(maxsize=None)
+def _get_origin_matcher(origins: tuple[Origin, ...]) -> OriginMatcher:
+    return OriginMatcher(origins)
 
 
-def _get_allow_origins(app: Sanic) -> tuple[re.Pattern, ...]:
+def _combine_patterns(
+    patterns: Sequence[re.Pattern],
+) -> tuple[re.Pattern, ...]:
+    """
+    Join patterns that share the same flags into a single alternation, so
+    that a miss costs one regex call instead of one per pattern. Patterns
+    that cannot be joined, for example because of inline global flags, are
+    kept as they are.
+    """
+    by_flags: dict[int, list[re.Pattern]] = defaultdict(list)
+    for pattern in patterns:
+        by_flags[pattern.flags].append(pattern)
+
+    combined: list[re.Pattern] = []
+    for flags, group in by_flags.items():
+        if len(group) == 1:
+            combined.extend(group)
+            continue
+        try:
+            combined.append(
+                re.compile(
+                    "|".join(f"(?:{pattern.pattern})" for pattern in group),
+                    flags,
+                )
+            )
+        except (re.error, TypeError):
+            combined.extend(group)
+    return tuple(combined)
+
+
+def _add_allow_header(
+    request: Request, response: HTTPResponse, allow_headers: frozenset[str]
+) -> None:
+    request_headers = {
+        h.strip().lower()
+        for h in request.headers.get(REQUEST_HEADERS_HEADER, "").split(",")
+    }
+    if headers := request_headers & allow_headers:
+        response.headers[ALLOW_HEADERS_HEADER] = ",".join(headers)
+
+
+def _get_allow_origins(app: Sanic) -> tuple[Origin, ...]:
     origins = app.config.CORS_ORIGINS
     return _parse_allow_origins(origins)
 
 
 def _parse_allow_origins(
-    value: Union[str, re.Pattern, list[Union[str, re.Pattern]]],
-) -> tuple[re.Pattern, ...]:
-    origins: Optional[
-        Union[list[str], list[re.Pattern], list[Union[str, re.Pattern]]]
-    ] = None
+    value: Union[str, re.Pattern, list[Origin]],
+) -> tuple[Origin, ...]:
+    origins: Optional[list[Origin]] = None
     if value and isinstance(value, str):
         if value == "*":
             origins = [WILDCARD_PATTERN]
@@ -320,12 +428,7 @@ def _parse_allow_origins(
     elif isinstance(value, list):
         origins = value
 
-    return tuple(
-        pattern
-        if isinstance(pattern, re.Pattern)
-        else re.compile(re.escape(pattern) + "$")
-        for pattern in (origins or [])
-    )
+    return tuple(origins or [])
 
 
 def _get_expose_headers(app: Sanic) -> frozenset[str]:
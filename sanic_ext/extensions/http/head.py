@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from email.utils import formatdate
+from inspect import isawaitable
+from os import path
+from pathlib import PurePath
+from time import time
+from typing import Any, Callable, Optional, Union
+
+from sanic import HTTPResponse, Request
+from sanic.compat import Header, stat_async
+from sanic.response import ResponseStream
+from sanic.response.convenience import guess_content_type
+
+
+HeadHook = Callable[..., Any]
+
+DEFAULT_CONTENT_TYPE = "text/plain; charset=utf-8"
+
+
+def head_metadata(hook: HeadHook):
+    """
+    Answer automatic HEAD requests to a GET handler with ``hook`` instead
+    of running the handler. The hook receives the same arguments as the
+    handler, and should return either a response without a body or a
+    mapping of headers. Remember to include ``content-length``, since the
+    length of the body that is not sent cannot be worked out otherwise.
+    A mapping without ``content-type`` is sent as
+    ``text/plain; charset=utf-8``, the default of ``sanic.response.text``.
+
+    .. code-block:: python
+
+        @app.get("/report/<report_id>")
+        @head_metadata(report_metadata)
+        async def report(request, report_id: str):
+            ...
+
+    :param hook: A (possibly async) callable that describes the response
+    :type hook: Callable[..., Any]
+    """
+
+    def decorator(f):
+        f.__head_metadata__ = hook
+        return f
+
+    return decorator
+
+
+async def file_metadata(
+    location: Union[str, PurePath],
+    status: int = 200,
+    mime_type: Optional[str] = None,
+    headers: Optional[dict[str, str]] = None,
+    filename: Optional[str] = None,
+    max_age: Optional[Union[float, int]] = None,
+    no_store: Optional[bool] = None,
+    etag: bool = False,
+) -> HTTPResponse:
+    """
+    The headers that ``sanic.response.file`` would send for a file, worked
+    out from ``os.stat`` without opening or reading it. Meant to be used as,
+    or from, a ``head_metadata`` hook.
+
+    :param etag: Also send a weak ETag made from the size and modification
+        time of the file. Only do this if the GET handler sends the same
+        ETag, defaults to False
+    :type etag: bool, optional
+    """
+    stat = await stat_async(location)
+    headers = dict(headers or {})
+    headers["content-length"] = str(stat.st_size)
+    headers.setdefault("last-modified", formatdate(stat.st_mtime, usegmt=True))
+    if etag:
+        headers.setdefault(
+            "etag", f'W/"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+        )
+
+    if filename:
+        headers.setdefault(
+            "content-disposition", f'attachment; filename="{filename}"'
+        )
+
+    if no_store:
+        cache_control = "no-store"
+    elif max_age:
+        cache_control = f"public, max-age={max_age}"
+        headers.setdefault(
+            "expires", formatdate(time() + max_age, usegmt=True)
+        )
+    else:
+        cache_control = "no-cache"
+    headers.setdefault("cache-control", cache_control)
+
+    filename = filename or path.split(location)[-1]
+    content_type = mime_type or guess_content_type(
+        filename, fallback=DEFAULT_CONTENT_TYPE
+    )
+    return HTTPResponse(
+        status=status, headers=headers, content_type=content_type
+    )
+
+
+async def respond_to_head(
+    request: Request, get_handler: Callable[..., Any], *args, **kwargs
+):
+    if hook := getattr(get_handler, "__head_metadata__", None):
+        retval = hook(request, *args, **kwargs)
+        if isawaitable(retval):
+            retval = await retval
+        if isinstance(retval, Mapping):
+            headers = Header(retval)
+            content_type = headers.pop("content-type", DEFAULT_CONTENT_TYPE)
+            retval = HTTPResponse(headers=headers, content_type=content_type)
+        return retval
+
+    retval = get_handler(request, *args, **kwargs)
+    if isawaitable(retval):
+        retval = await retval
+
+    # When the length of a stream is known up front, there is nothing that
+    # the stream itself could add to the response to a HEAD request.
+    if isinstance(retval, ResponseStream) and "content-length" in (
+        retval.headers
+    ):
+        return HTTPResponse(
+            status=retval.status,
+            headers=retval.headers,
+            content_type=retval.content_type,
+        )
+    return retval
@@ -1,15 +1,17 @@
 from collections.abc import Sequence
 from functools import partial
-from inspect import isawaitable
 from operator import itemgetter
-from typing import Union
+from time import perf_counter
+from typing import Any, Union
 
 from sanic import Sanic
 from sanic.constants import HTTPMethod
-from sanic.exceptions import SanicException
+from sanic.exceptions import PayloadTooLarge, SanicException
+from sanic.log import logger
 from sanic.response import empty, raw
 
 from sanic_ext.config import PRIORITY
+from sanic_ext.extensions.http.head import respond_to_head
 from sanic_ext.extensions.openapi import openapi
 from sanic_ext.utils.route import clean_route_name
 
@@ -41,106 +43,118 @@ def add_auto_handlers(
             "has been set."
         )
 
-    async def head_handler(request, get_handler, *args, **kwargs):
-        retval = get_handler(request, *args, **kwargs)
-        if isawaitable(retval):
-            retval = await retval
-        return retval
-
     async def options_handler(request, methods, *args, **kwargs):
         resp = empty()
         resp.headers["allow"] = ",".join([*methods, "OPTIONS"])
         return resp
 
-    async def trace_handler(request):
-        cleaned_head = b""
-        for line in request.head.split(b"\r\n"):
-            first_word, _ = line.split(b" ", 1)
-
-            if (
-                first_word.lower().replace(b":", b"").decode("utf-8")
-                not in request.app.config.TRACE_EXCLUDED_HEADERS
-            ):
-                cleaned_head += line + b"\r\n"
-
-        message = "\r\n\r\n".join(
-            [part.decode("utf-8") for part in [cleaned_head, request.body]]
+    async def trace_handler(request, excluded, max_size, **_):
+        head, body = request.head, request.body
+        if len(head) + len(body) > max_size:
+            raise PayloadTooLarge("Request is too large to be echoed")
+
+        request_line, *lines = head.split(b"\r\n")
+        message = [request_line]
+        message.extend(
+            line
+            for line in lines
+            if line.split(b":", 1)[0].strip().lower() not in excluded
         )
-        return raw(message, content_type="message/http")
+        message += (b"", body)
+        return raw(b"\r\n".join(message), content_type="message/http")
 
     @app.before_server_start(priority=PRIORITY)
     def _add_handlers(app):
-        nonlocal auto_head
-        nonlocal auto_options
-
-        if auto_head:
-            app.router.reset()
-            for group in app.router.groups.values():
-                if "GET" in group.methods and "HEAD" not in group.methods:
-                    for route in group:
-                        if "GET" in route.methods:
-                            host = route.requirements.get("host")
-                            name = f"{route.name}_head"
-                            handler = openapi.definition(
-                                summary=clean_route_name(route.name).title(),
-                                description="Retrieve HEAD details",
-                            )(partial(head_handler, get_handler=route.handler))
-                            handler.__auto_handler__ = True
-                            handler.__route_handler__ = route.handler
-                            app.add_route(
-                                handler=handler,
-                                uri=group.uri,
-                                methods=["HEAD"],
-                                strict_slashes=group.strict,
-                                name=name,
-                                host=host,
-                                unquote=group.unquote,
-                            )
-            app.finalize()
-
+        start = perf_counter()
+        routes: list[dict[str, Any]] = []
         if auto_trace:
-            app.router.reset()
-            for group in app.router.groups.values():
-                if "TRACE" not in group.methods:
-                    app.add_route(
-                        handler=trace_handler,
-                        uri=group.uri,
-                        methods=["TRACE"],
-                        strict_slashes=group.strict,
-                    )
-            app.finalize()
-
-        if auto_options:
-            app.router.reset()
-            for group in app.router.groups.values():
-                if "OPTIONS" not in group.methods:
-                    if not group.requirements:
-                        hosts = [None]
-                    else:
-                        hosts = set(
-                            map(itemgetter("host"), group.requirements)
+            excluded = app.config.TRACE_EXCLUDED_HEADERS
+            if isinstance(excluded, str):
+                excluded = excluded.split(",")
+            trace = partial(
+                trace_handler,
+                excluded=frozenset(
+                    header.strip().lower().encode() for header in excluded
+                ),
+                max_size=app.config.TRACE_MAX_SIZE,
+            )
+
+        # Everything is collected from the routes as they were defined, and
+        # then added at once, so that the router is only rebuilt one time.
+        for group in app.router.groups.values():
+            methods = set(group.methods)
+
+            if auto_head and "GET" in methods and "HEAD" not in methods:
+                methods.add("HEAD")
+                for route in group:
+                    if "GET" in route.methods:
+                        handler = openapi.definition(
+                            summary=clean_route_name(route.name).title(),
+                            description="Retrieve HEAD details",
+                        )(partial(respond_to_head, get_handler=route.handler))
+                        handler.__auto_handler__ = True
+                        handler.__route_handler__ = route.handler
+                        routes.append(
+                            {
+                                "handler": handler,
+                                "uri": group.uri,
+                                "methods": ["HEAD"],
+                                "strict_slashes": group.strict,
+                                "name": f"{route.name}_head",
+                                "host": route.requirements.get("host"),
+                                "unquote": group.unquote,
+                            }
                         )
 
-                    try:
-                        base_route = next(
-                            r for r in group if not r.name.endswith("_head")
-                        )
-                    except StopIteration:
-                        base_route = group[0]
-
-                    name = f"{base_route.name}_options"
-                    handler = openapi.definition(
-                        summary=clean_route_name(base_route.name).title(),
-                        description="Retrieve OPTIONS details",
-                    )(partial(options_handler, methods=group.methods))
-                    handler.__auto_handler__ = True
-                    app.add_route(
-                        handler=handler,
-                        uri=group.uri,
-                        methods=["OPTIONS"],
-                        strict_slashes=group.strict,
-                        name=name,
-                        host=hosts,
-                        unquote=group.unquote,
-                    )
+            try:
+                base_route = next(
+                    r for r in group if not r.name.endswith("_head")
+                )
+            except StopIteration:
+                base_route = group[0]
+
+            if auto_trace and "TRACE" not in methods:
+                methods.add("TRACE")
+                routes.append(
+                    {
+                        "handler": trace,
+                        "uri": group.uri,
+                        "methods": ["TRACE"],
+                        "strict_slashes": group.strict,
+                        "name": f"{base_route.name}_trace",
+                    }
+                )
+
+            if auto_options and "OPTIONS" not in methods:
+                if not group.requirements:
+                    hosts = [None]
+                else:
+                    hosts = set(map(itemgetter("host"), group.requirements))
+
+                handler = openapi.definition(
+                    summary=clean_route_name(base_route.name).title(),
+                    description="Retrieve OPTIONS details",
+                )(partial(options_handler, methods=frozenset(methods)))
+                handler.__auto_handler__ = True
+                routes.append(
+                    {
+                        "handler": handler,
+                        "uri": group.uri,
+                        "methods": ["OPTIONS"],
+                        "strict_slashes": group.strict,
+                        "name": f"{base_route.name}_options",
+                        "host": hosts,
+                        "unquote": group.unquote,
+                    }
+                )
+
+        if routes:
+            app.router.reset()
+            for route_kwargs in routes:
+                app.add_route(**route_kwargs)
             app.finalize()
+
+        logger.debug(
+            f"Added {len(routes)} automatic HEAD/OPTIONS/TRACE routes in "
+            f"{(perf_counter() - start) * 1000:.1f}ms"
+        )
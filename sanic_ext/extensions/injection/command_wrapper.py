@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+from contextlib import AsyncExitStack
 from functools import wraps
 from inspect import isclass, iscoroutine
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Optional,
     Union,
     get_args,
     get_origin,
     get_type_hints,
 )
+from weakref import WeakKeyDictionary
 
 from sanic import Request
 
@@ -23,20 +26,47 @@ if TYPE_CHECKING:
     from .registry import InjectionRegistry
 
 
+ResolutionPlan = tuple[tuple[str, type], ...]
+
+# Constructor -> (registry version, names and types of its dependencies)
+_nested_plans: WeakKeyDictionary[Constructor, tuple[int, ResolutionPlan]] = (
+    WeakKeyDictionary()
+)
+
+
 def create_command_wrapper(func: Callable, app: Sanic) -> Callable:
     original = _unwrap(func)
+    hints: Optional[dict[str, Any]] = None
+    plan: tuple[int, ResolutionPlan] = (-1, ())
 
     @wraps(func)
     async def wrapped(**kwargs):
+        nonlocal hints, plan
+
         ext = getattr(app, "_ext", None)
         registry = getattr(ext, "_injection_registry", None) if ext else None
         if not registry:
             return await _maybe_await(func(**kwargs))
 
-        hints = _get_hints(original)
-        kwargs = await _inject_dependencies(kwargs, hints, registry)
-        kwargs = _inject_constants(kwargs, hints, ext, app)
-        return await _maybe_await(func(**kwargs))
+        if hints is None:
+            hints = _get_hints(original)
+        if plan[0] != registry.version:
+            plan = (
+                registry.version,
+                tuple(
+                    (param, annotation)
+                    for param, annotation in hints.items()
+                    if annotation in registry
+                ),
+            )
+        # Dependencies from async generators are released once the
+        # command has finished
+        async with AsyncExitStack() as exit_stack:
+            kwargs = await _inject_dependencies(
+                kwargs, plan[1], registry, exit_stack
+            )
+            kwargs = _inject_constants(kwargs, hints, ext, app)
+            return await _maybe_await(func(**kwargs))
 
     return wrapped
 
@@ -65,13 +95,15 @@ async def _maybe_await(result: Any) -> Any:
 
 
 async def _inject_dependencies(
-    kwargs: dict, hints: dict, registry: InjectionRegistry
+    kwargs: dict,
+    plan: ResolutionPlan,
+    registry: InjectionRegistry,
+    exit_stack: AsyncExitStack,
 ) -> dict:
-    for param, annotation in hints.items():
+    for param, annotation in plan:
         if param in kwargs and kwargs[param] is not None:
             continue
-        if annotation in registry:
-            kwargs[param] = await _resolve(annotation, registry, [])
+        kwargs[param] = await _resolve(annotation, registry, [], exit_stack)
     return kwargs
 
 
@@ -86,7 +118,10 @@ def _inject_constants(kwargs: dict, hints: dict, ext: Any, app: Sanic) -> dict:
 
 
 async def _resolve(
-    annotation: type, registry: InjectionRegistry, resolving: list[type]
+    annotation: type,
+    registry: InjectionRegistry,
+    resolving: list[type],
+    exit_stack: AsyncExitStack,
 ) -> Any:
     if annotation in resolving:
         chain = " -> ".join(getattr(t, "__name__", str(t)) for t in resolving)
@@ -103,23 +138,28 @@ async def _resolve(
 
     resolving.append(annotation)
     try:
-        hints = _get_hints(constructor.func)
-        nested_kwargs = await _resolve_nested(
-            annotation, hints, registry, resolving
-        )
-        return await _maybe_await(constructor.func(**nested_kwargs))
+        plan = _nested_plan(annotation, constructor, registry)
+        nested_kwargs = {
+            name: await _resolve(param_type, registry, resolving, exit_stack)
+            for name, param_type in plan
+        }
+        retval = constructor.func(**nested_kwargs)
+        if constructor.managed:
+            return await exit_stack.enter_async_context(retval)
+        return await _maybe_await(retval)
     finally:
         resolving.pop()
 
 
-async def _resolve_nested(
-    annotation: type,
-    hints: dict,
-    registry: InjectionRegistry,
-    resolving: list[type],
-) -> dict[str, Any]:
-    result: dict[str, Any] = {}
-    for name, param_type in hints.items():
+def _nested_plan(
+    annotation: type, constructor: Constructor, registry: InjectionRegistry
+) -> ResolutionPlan:
+    cached = _nested_plans.get(constructor)
+    if cached and cached[0] == registry.version:
+        return cached[1]
+
+    plan: list[tuple[str, type]] = []
+    for name, param_type in _get_hints(constructor.func).items():
         if _is_optional_request(param_type):
             continue
         if _is_required_request(param_type):
@@ -129,8 +169,10 @@ async def _resolve_nested(
                 f"the constructor requires a Request object."
             )
         if param_type in registry:
-            result[name] = await _resolve(param_type, registry, resolving)
-    return result
+            plan.append((name, param_type))
+
+    _nested_plans[constructor] = (registry.version, tuple(plan))
+    return tuple(plan)
 
 
 def _is_optional_request(param_type: type) -> bool:
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+from asyncio import Lock, Task, ensure_future, gather
+from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import is_dataclass
-from inspect import isclass, iscoroutine
+from enum import Enum
+from inspect import isasyncgenfunction, isclass, iscoroutine, unwrap
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Optional,
+    Union,
     get_args,
     get_type_hints,
 )
@@ -14,6 +18,7 @@ from typing import (
 from sanic import Request
 from sanic.app import Sanic
 from sanic.exceptions import ServerError
+from sanic.log import logger
 
 from sanic_ext.exceptions import InitError
 from sanic_ext.utils.typing import (
@@ -28,17 +33,49 @@ if TYPE_CHECKING:
     from .registry import ConstantRegistry, InjectionRegistry
 
 
+class Scope(str, Enum):
+    """
+    How long an injected dependency lives once it has been constructed.
+
+    - ``TRANSIENT``: a new instance every time it is injected
+    - ``REQUEST``: one instance shared by everything within a request
+    - ``WORKER``: one instance per worker process, built on first use
+    - ``APP``: one instance per worker process, built at server startup
+    """
+
+    TRANSIENT = "transient"
+    REQUEST = "request"
+    WORKER = "worker"
+    APP = "app"
+
+
+_MISSING = object()
+
+
 class Constructor:
     EXEMPT_ANNOTATIONS = (Request,)
 
     def __init__(
-        self, func: Callable[..., Any], request_arg: Optional[str] = None
+        self,
+        func: Callable[..., Any],
+        request_arg: Optional[str] = None,
+        concurrent: bool = False,
+        scope: Union[str, Scope] = Scope.TRANSIENT,
     ):
+        self.managed = isasyncgenfunction(unwrap(func))
+        if isasyncgenfunction(func):
+            func = asynccontextmanager(func)
         self.func = func
         self.injections: dict[str, tuple[type, Constructor]] = {}
         self.constants: dict[str, Any] = {}
         self.pass_kwargs: bool = False
         self.request_arg = request_arg
+        self.concurrent = concurrent
+        self.concurrent_injections: tuple[str, ...] = ()
+        self.scope = Scope(scope)
+        self._instance: Any = _MISSING
+        self._lock: Optional[Lock] = None
+        self._exit_stack: Optional[AsyncExitStack] = None
 
     def __str__(self) -> str:
         return f"<{self.__class__.__name__}:{self.func.__name__}>"
@@ -47,8 +84,37 @@ class Constructor:
         return f"<{self.__class__.__name__}(func={self.func.__name__})>"
 
     async def __call__(self, request, **kwargs):
+        if self.scope is Scope.TRANSIENT:
+            return await self._construct(request, **kwargs)
+
+        if self.scope is Scope.REQUEST:
+            if request is None:
+                return await self._construct(request, **kwargs)
+            cache = getattr(request.ctx, "_injected", None)
+            if cache is None:
+                cache = request.ctx._injected = {}
+            if (pending := cache.get(self)) is None:
+                pending = cache[self] = ensure_future(
+                    self._construct(request, **kwargs)
+                )
+            return await pending
+
+        if self._instance is _MISSING:
+            if self._lock is None:
+                self._lock = Lock()
+            async with self._lock:
+                if self._instance is _MISSING:
+                    self._instance = await self._construct(None)
+        return self._instance
+
+    async def _construct(self, request, **kwargs):
         try:
-            args = await gather_args(self.injections, request, **kwargs)
+            args = await gather_args(
+                self.injections,
+                request,
+                self.concurrent_injections,
+                **kwargs,
+            )
             args.update(self.constants)
             if self.pass_kwargs:
                 args.update(kwargs)
@@ -58,6 +124,10 @@ class Constructor:
 
             retval = self.func(**args)
 
+            if self.managed:
+                return await self._exit_stack_for(request).enter_async_context(
+                    retval
+                )
             if iscoroutine(retval):
                 retval = await retval
             return retval
@@ -68,6 +138,13 @@ class Constructor:
                 "registered."
             ) from e
 
+    def _exit_stack_for(self, request) -> AsyncExitStack:
+        if request is None or self.scope in (Scope.WORKER, Scope.APP):
+            if self._exit_stack is None:
+                self._exit_stack = AsyncExitStack()
+            return self._exit_stack
+        return request_exit_stack(request)
+
     def prepare(
         self,
         app: Sanic,
@@ -117,6 +194,42 @@ class Constructor:
         checked: set[type[object]] = set()
         current: set[type[object]] = set()
         self.check_circular(checked, current)
+        self.concurrent_injections = concurrent_names(self.injections)
+        self._instance = _MISSING
+
+    def check_scope(self) -> None:
+        if (
+            self.scope in (Scope.WORKER, Scope.APP)
+            and self._requires_request()
+        ):
+            raise InitError(
+                f"Cannot use the '{self.scope.value}' scope for "
+                f"'{self.func.__name__}'. Dependencies that outlive a request "
+                "cannot depend upon the request, its route parameters, or "
+                "dependencies with the 'request' scope."
+            )
+
+    async def startup(self) -> None:
+        if self.scope is not Scope.APP or self._instance is not _MISSING:
+            return
+        self._instance = await self._construct(None)
+
+    async def shutdown(self) -> None:
+        self._instance = _MISSING
+        if self._exit_stack is not None:
+            exit_stack, self._exit_stack = self._exit_stack, None
+            await exit_stack.aclose()
+
+    def _requires_request(self) -> bool:
+        return bool(self.request_arg or self.pass_kwargs) or any(
+            constructor.scope is Scope.REQUEST
+            or (
+                constructor.scope is Scope.TRANSIENT
+                and constructor._requires_request()
+            )
+            for _, constructor in self.injections.values()
+            if isinstance(constructor, Constructor)
+        )
 
     def check_circular(
         self,
@@ -163,11 +276,120 @@ class Constructor:
         raise InitError(f"Cannot get type hints for {self.func}")
 
 
-async def gather_args(injections, request, **kwargs) -> dict[str, Any]:
-    return {
-        name: await do_cast(_type, constructor, request, **kwargs)
-        for name, (_type, constructor) in injections.items()
-    }
+def request_exit_stack(
+    request: Request, task: Optional[Task] = None
+) -> AsyncExitStack:
+    """
+    The stack that holds the context managers of dependencies constructed
+    for a request. As a safety net for requests that never reach the
+    response or exception signals (for example because the client went
+    away), the stack is also closed when the given task finishes. That
+    must be the task serving the request: dependencies may be constructed
+    in short lived child tasks, so the stack is opened before resolving
+    them.
+    """
+    exit_stack = getattr(request.ctx, "_exit_stack", None)
+    if exit_stack is None:
+        exit_stack = request.ctx._exit_stack = AsyncExitStack()
+        if task:
+
+            def _close(_):
+                if getattr(request.ctx, "_exit_stack", None) is exit_stack:
+                    ensure_future(teardown_request(request))
+
+            request.ctx._exit_task = (task, _close)
+            task.add_done_callback(_close)
+    return exit_stack
+
+
+async def teardown_request(
+    request: Request, exception: Optional[BaseException] = None
+) -> None:
+    exit_stack = getattr(request.ctx, "_exit_stack", None)
+    if exit_stack is None:
+        return
+    request.ctx._exit_stack = None
+    if exit_task := getattr(request.ctx, "_exit_task", None):
+        task, callback = exit_task
+        task.remove_done_callback(callback)
+        request.ctx._exit_task = None
+    try:
+        if exception is None:
+            await exit_stack.aclose()
+        else:
+            await exit_stack.__aexit__(
+                type(exception), exception, exception.__traceback__
+            )
+    except Exception:
+        logger.exception("Failure while tearing down injected dependencies")
+
+
+def needs_exit_stack(injections) -> bool:
+    """
+    Whether resolving the injections may enter a context manager that has
+    to be released along with the request.
+    """
+    return any(
+        constructor.scope in (Scope.TRANSIENT, Scope.REQUEST)
+        and (constructor.managed or needs_exit_stack(constructor.injections))
+        for _, constructor in injections.values()
+        if isinstance(constructor, Constructor)
+    )
+
+
+def concurrent_names(injections) -> tuple[str, ...]:
+    """
+    Names of the injections whose constructors opted in to concurrent
+    resolution. Returns an empty tuple when fewer than two did, since
+    there would be nothing to run alongside.
+    """
+    names = tuple(
+        name
+        for name, (_, constructor) in injections.items()
+        if getattr(constructor, "concurrent", False)
+    )
+    return names if len(names) > 1 else ()
+
+
+async def gather_args(
+    injections, request, concurrent=(), /, **kwargs
+) -> dict[str, Any]:
+    if not concurrent:
+        return {
+            name: await do_cast(_type, constructor, request, **kwargs)
+            for name, (_type, constructor) in injections.items()
+        }
+
+    # Consecutive concurrent dependencies are resolved together at their
+    # position, so that everything else keeps its declaration order
+    resolved: dict[str, Any] = {}
+    batch: list[str] = []
+    for name, (_type, constructor) in injections.items():
+        if name in concurrent:
+            batch.append(name)
+            continue
+        if batch:
+            await _gather_batch(batch, injections, request, resolved, kwargs)
+            batch = []
+        resolved[name] = await do_cast(_type, constructor, request, **kwargs)
+    if batch:
+        await _gather_batch(batch, injections, request, resolved, kwargs)
+    return resolved
+
+
+async def _gather_batch(names, injections, request, resolved, kwargs) -> None:
+    tasks = [
+        ensure_future(do_cast(*injections[name], request, **kwargs))
+        for name in names
+    ]
+    try:
+        resolved.update(zip(names, await gather(*tasks)))
+    except BaseException:
+        # Do not leave the siblings of a failed dependency running
+        for task in tasks:
+            task.cancel()
+        await gather(*tasks, return_exceptions=True)
+        raise
 
 
 async def do_cast(_type, constructor, request, **kwargs):
@@ -6,9 +6,11 @@ from typing import Any, Callable, Optional, get_type_hints
 
 from sanic import Sanic
 from sanic.constants import HTTP_METHODS
+from sanic.signals import Event
+from sanic_routing import Route
 
 from sanic_ext.config import PRIORITY
-from sanic_ext.extensions.injection.constructor import gather_args
+from sanic_ext.extensions.injection.constructor import teardown_request
 
 from .registry import ConstantRegistry, InjectionRegistry, SignatureRegistry
 
@@ -18,9 +20,7 @@ def add_injection(
     injection_registry: InjectionRegistry,
     constant_registry: ConstantRegistry,
 ) -> None:
-    signature_registry = _setup_signature_registry(
-        app, injection_registry, constant_registry
-    )
+    _setup_signature_registry(app, injection_registry, constant_registry)
 
     @app.listener("before_server_start", priority=PRIORITY)
     async def finalize_injections(app: Sanic):
@@ -36,31 +36,40 @@ def add_injection(
                 if return_type := hints.get("return"):
                     router_types.add(return_type)
         injection_registry.finalize(app, constant_registry, router_types)
+        await injection_registry.startup()
+
+    @app.listener("after_server_stop", priority=PRIORITY)
+    async def teardown_injections(app: Sanic):
+        await injection_registry.shutdown()
+
+    _setup_teardown(app)
 
     injection_signal = app.ext.config.INJECTION_SIGNAL
     injection_priority = app.ext.config.INJECTION_PRIORITY
 
     @app.signal(injection_signal, priority=injection_priority)
     async def inject_kwargs(request, **_):
-        nonlocal signature_registry
-
-        for name in (
-            request.route.name,
-            f"{request.route.name}_{request.method.lower()}",
-        ):
-            dependencies, constants = signature_registry.get(
-                name, (None, None)
-            )
-            if dependencies or constants:
-                break
-
-        if dependencies:
-            injected_args = await gather_args(
-                dependencies, request, **request.match_info
-            )
-            request.match_info.update(injected_args)
-        if constants:
-            request.match_info.update(constants)
+        plans = getattr(request.route.ctx, "_injections", None)
+        if plans and (plan := plans.get(request.method)):
+            await plan(request)
+
+
+def _setup_teardown(app: Sanic) -> None:
+    """
+    Close the context managers of request bound dependencies once the
+    response has been sent, or when the request fails. These are always
+    registered, since a dependency may be added after Sanic has already
+    removed the dispatch of signals without handlers.
+    """
+
+    @app.signal(Event.HTTP_LIFECYCLE_EXCEPTION)
+    async def teardown_on_exception(request, exception, **_):
+        if request is not None:
+            await teardown_request(request, exception)
+
+    @app.signal(Event.HTTP_LIFECYCLE_RESPONSE)
+    async def teardown_on_response(request, **_):
+        await teardown_request(request)
 
 
 def _http_method_predicate(member):
@@ -79,6 +88,7 @@ def _setup_signature_registry(
         nonlocal registry
 
         for route in app.router.routes:
+            route.ctx._injections = {}
             if ".openapi." in route.name:
                 continue
             handlers = [(route.name, route.handler)]
@@ -120,4 +130,21 @@ def _setup_signature_registry(
 
                 registry.register(name, dependencies, constants)
 
+            _compile_plans(route, registry)
+
     return registry
+
+
+def _compile_plans(route: Route, registry: SignatureRegistry) -> None:
+    """
+    Attach the injection plan for each method of a route to its context.
+    Methods that have nothing to inject are left out so that the signal
+    handler can return early without doing any work.
+    """
+    viewclass = getattr(route.handler, "view_class", None)
+    for method in route.methods:
+        plan = registry.plan(
+            f"{route.name}_{method.lower()}" if viewclass else route.name
+        )
+        if plan:
+            route.ctx._injections[method] = plan
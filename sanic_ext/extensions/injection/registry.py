@@ -1,16 +1,25 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Optional
+from asyncio import current_task
+from typing import Any, Callable, Optional, Union
 
 from sanic.app import Sanic
 from sanic.config import Config
 
-from .constructor import Constructor
+from .constructor import (
+    Constructor,
+    Scope,
+    concurrent_names,
+    gather_args,
+    needs_exit_stack,
+    request_exit_stack,
+)
 
 
 class InjectionRegistry:
     def __init__(self):
         self._registry: dict[type, Optional[Callable[..., Any]]] = {}
+        self.version = 0
 
     def __getitem__(self, key):
         return self._registry[key]
@@ -29,10 +38,18 @@ class InjectionRegistry:
         _type: type,
         constructor: Optional[Callable[..., Any]],
         request_arg: Optional[str] = None,
+        concurrent: bool = False,
+        scope: Union[str, Scope] = Scope.TRANSIENT,
     ) -> None:
         constructor = constructor or _type
-        constructor = Constructor(constructor, request_arg=request_arg)
+        constructor = Constructor(
+            constructor,
+            request_arg=request_arg,
+            concurrent=concurrent,
+            scope=scope,
+        )
         self._registry[_type] = constructor
+        self.version += 1
 
     def finalize(
         self, app: Sanic, constant_registry: ConstantRegistry, allowed_types
@@ -42,6 +59,19 @@ class InjectionRegistry:
                 constructor.prepare(
                     app, self, constant_registry, allowed_types
                 )
+        for constructor in self._registry.values():
+            if isinstance(constructor, Constructor):
+                constructor.check_scope()
+
+    async def startup(self) -> None:
+        for constructor in self._registry.values():
+            if isinstance(constructor, Constructor):
+                await constructor.startup()
+
+    async def shutdown(self) -> None:
+        for constructor in self._registry.values():
+            if isinstance(constructor, Constructor):
+                await constructor.shutdown()
 
     @property
     def length(self):
@@ -75,6 +105,45 @@ class SignatureRegistry:
     ) -> None:
         self._registry[route_name] = (dependencies, constants or {})
 
+    def plan(self, route_name: str) -> InjectionPlan:
+        return InjectionPlan(*self._registry.get(route_name, ({}, {})))
+
+
+class InjectionPlan:
+    """
+    The precompiled set of dependencies and constants to inject into a
+    single route handler. Built once at startup and attached to the route.
+    """
+
+    __slots__ = ("dependencies", "constants", "concurrent", "managed")
+
+    def __init__(
+        self,
+        dependencies: dict[str, tuple[type, Optional[Callable[..., Any]]]],
+        constants: dict[str, Any],
+    ) -> None:
+        self.dependencies = dependencies
+        self.constants = constants
+        self.concurrent = concurrent_names(dependencies)
+        self.managed = needs_exit_stack(dependencies)
+
+    def __bool__(self) -> bool:
+        return bool(self.dependencies or self.constants)
+
+    async def __call__(self, request) -> None:
+        if self.managed:
+            request_exit_stack(request, current_task())
+        if self.dependencies:
+            injected_args = await gather_args(
+                self.dependencies,
+                request,
+                self.concurrent,
+                **request.match_info,
+            )
+            request.match_info.update(injected_args)
+        if self.constants:
+            request.match_info.update(self.constants)
+
 
 class ConstantRegistry:
     def __init__(self, config: Config):
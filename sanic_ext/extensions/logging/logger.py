@@ -1,21 +1,171 @@
 import logging
 
-from collections import defaultdict
+from asyncio import sleep
+from collections import Counter, defaultdict
 from logging import LogRecord
 from logging.handlers import QueueHandler
-from multiprocessing import Manager
+from math import ceil
+from multiprocessing import Queue
 from queue import Empty, Full
+from random import random
 from signal import SIGINT, SIGTERM
 from signal import signal as signal_func
+from time import monotonic
+from typing import Optional, TypeVar, Union
 
 from sanic import Sanic
+from sanic.exceptions import SanicException
 from sanic.log import logger as root_logger
 from sanic.log import logger as server_logger
+from sanic.logging.formatter import JSONAccessFormatter, JSONFormatter
 from sanic.logging.setup import setup_logging
 
 from sanic_ext.extensions.logging.extractor import LoggingConfigExtractor
 
 
+PREFORMAT_OPTIONS = ("", "text", "json")
+OVERFLOW_POLICIES = ("emit", "drop", "sample")
+
+T = TypeVar("T")
+
+# A record that was formatted in the worker: (logger name, level, message)
+Preformatted = tuple[str, int, str]
+
+
+class PreformattedFormatter(logging.Formatter):
+    """Writes out the message of a record that was formatted in a worker."""
+
+    def format(self, record: LogRecord) -> str:
+        return record.getMessage()
+
+
+def for_logger(values: dict[str, T], name: str, default: T) -> T:
+    """
+    The value for a logger, or else for its closest parent that has one.
+    Records of child loggers reach the queue handler through propagation,
+    and are treated like those of that parent. Lookups are cached.
+    """
+    try:
+        return values[name]
+    except KeyError:
+        ...
+    parent = name.rpartition(".")[0]
+    value = for_logger(values, parent, default) if parent else default
+    values[name] = value
+    return value
+
+
+def to_record(item: Union[LogRecord, Preformatted]) -> LogRecord:
+    if isinstance(item, LogRecord):
+        return item
+    name, levelno, msg = item
+    return logging.makeLogRecord(
+        {
+            "name": name,
+            "levelno": levelno,
+            "levelname": logging.getLevelName(levelno),
+            "msg": msg,
+        }
+    )
+
+
+def describe(item: Union[LogRecord, Preformatted]) -> tuple[str, int]:
+    if isinstance(item, LogRecord):
+        return item.name, item.levelno
+    return item[0], item[1]
+
+
+class OverflowPolicy:
+    """
+    What a worker does with log records while the queue to the background
+    logger is full.
+
+    - ``"emit"`` writes them to stderr from the worker
+    - ``"drop"`` drops every record below ``keep_level``
+    - ``"sample"`` keeps a fraction of the records below ``keep_level``,
+      which can be set per logger with ``sample_rates``
+
+    Records at or above ``keep_level`` are never dropped. They are held
+    for the next flush, and only written from the worker when more than
+    ``max_held`` records are waiting. Dropped and sampled out records are
+    counted per logger until they are ``report``-ed.
+    """
+
+    def __init__(
+        self,
+        policy: str = "emit",
+        keep_level: int = logging.WARNING,
+        sample_rate: float = 0.1,
+        sample_rates: Optional[dict[str, float]] = None,
+        max_held: int = 4096,
+    ):
+        if policy not in OVERFLOW_POLICIES:
+            raise SanicException(
+                "LOGGING_OVERFLOW must be one of: "
+                + ", ".join(repr(option) for option in OVERFLOW_POLICIES)
+            )
+        self.policy = policy
+        self.keep_level = keep_level
+        self.sample_rate = sample_rate
+        self.sample_rates = dict(sample_rates or {})
+        self.max_held = max_held
+        self.dropped: Counter[str] = Counter()
+        self.sampled: Counter[str] = Counter()
+
+    @property
+    def sheds(self) -> bool:
+        return self.policy != "emit"
+
+    def admit(self, name: str, levelno: int) -> bool:
+        if levelno >= self.keep_level:
+            return True
+        if self.policy == "sample":
+            if random() < for_logger(
+                self.sample_rates, name, self.sample_rate
+            ):
+                return True
+            self.sampled[name] += 1
+        else:
+            self.dropped[name] += 1
+        return False
+
+    def trim(
+        self, held: list[Union[LogRecord, Preformatted]]
+    ) -> tuple[list[Union[LogRecord, Preformatted]], list[LogRecord]]:
+        """
+        Split the records that are waiting for the queue into those that
+        can keep waiting, and the oldest of the ones that must not be
+        dropped once there are too many of them.
+        """
+        excess = len(held) - self.max_held
+        if excess <= 0:
+            return held, []
+        emit = []
+        for item in held[:excess]:
+            name, levelno = describe(item)
+            if levelno >= self.keep_level:
+                emit.append(to_record(item))
+            else:
+                self.dropped[name] += 1
+        return held[excess:], emit
+
+    def report(self) -> Optional[str]:
+        shed = self.dropped + self.sampled
+        if not shed:
+            return None
+        details = ", ".join(
+            f"{name}: {count}" for name, count in shed.most_common()
+        )
+        message = (
+            f"Background logger was full. Dropped "
+            f"{sum(self.dropped.values())} and sampled out "
+            f"{sum(self.sampled.values())} records ({details})"
+        )
+        self.dropped.clear()
+        self.sampled.clear()
+        return message
+
+
 async def prepare_logger(app: Sanic, *_):
     Logger.prepare(app)
 
@@ -31,26 +181,229 @@ async def setup_logger(app: Sanic, *_):
         {
             "queue": app.shared_ctx.logger_queue,
             "config": extractor.compile(),
+            "preformatted": bool(app.config.LOGGING_PREFORMAT),
         },
         transient=True,
     )
 
 
 class SanicQueueHandler(QueueHandler):
+    """
+    Buffers records in the worker, and puts them on the queue as a list
+    once ``batch_size`` of them have been collected or when ``flush`` is
+    called. Every put is a single write to the pipe of the queue, so the
+    cost of getting records to the background logger is shared by the
+    whole batch.
+
+    When ``formatters`` is given, records are formatted here with the
+    formatter of their logger, and only the formatted message is sent
+    along with the name of the logger and the level.
+
+    When ``levels`` is given, records below the level of their logger are
+    dropped before they are prepared, since no handler of the background
+    logger would emit them.
+
+    What happens to records while the queue is full is decided by the
+    ``overflow`` policy.
+    """
+
+    def __init__(
+        self,
+        queue,
+        batch_size: int = 1,
+        formatters: Optional[dict[str, logging.Formatter]] = None,
+        levels: Optional[dict[str, int]] = None,
+        overflow: Optional[OverflowPolicy] = None,
+    ):
+        super().__init__(queue)
+        self.batch_size = batch_size
+        self.buffer: list[Union[LogRecord, Preformatted]] = []
+        self.formatters = formatters
+        self.levels = levels
+        self.overflow = overflow or OverflowPolicy()
+        self.overflowing = False
+        self.fallback = logging.StreamHandler()
+        if levels:
+            self.setLevel(min(levels.values()))
+
+    def prepare(self, record: LogRecord) -> Union[LogRecord, Preformatted]:
+        if self.formatters is None:
+            return super().prepare(record)
+        formatter = for_logger(
+            self.formatters, record.name, logging.Formatter()
+        )
+        return (record.name, record.levelno, formatter.format(record))
+
     def emit(self, record: LogRecord) -> None:
+        if self.levels is not None and record.levelno < for_logger(
+            self.levels, record.name, logging.NOTSET
+        ):
+            return
+        if self.overflowing and not self.overflow.admit(
+            record.name, record.levelno
+        ):
+            return
         try:
-            return self.enqueue(self.prepare(record))
-        except Full:
-            server_logger.warning(
-                "Background logger is full. Emitting log in process."
-            )
-            server_logger.handle(record)
+            self.buffer.append(self.prepare(record))
+            # While the queue is full, only the periodic flush retries it
+            if len(self.buffer) >= self.batch_size and not self.overflowing:
+                self.flush()
         except Exception:
             self.handleError(record)
 
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            batch, self.buffer = self.buffer, []
+            if batch:
+                try:
+                    self.enqueue(batch)
+                    self.overflowing = False
+                except Full:
+                    self.handle_overflow(batch)
+        finally:
+            self.release()
+
+    def handle_overflow(
+        self, batch: list[Union[LogRecord, Preformatted]]
+    ) -> None:
+        if not self.overflow.sheds:
+            self.emit_in_process(batch)
+            return
+        if not self.overflowing:
+            # Records that were buffered before the queue filled up
+            self.overflowing = True
+            batch = [
+                item for item in batch if self.overflow.admit(*describe(item))
+            ]
+        held, emit = self.overflow.trim(batch)
+        self.buffer = held + self.buffer
+        if emit:
+            self.emit_in_process(emit)
+
+    def report(self) -> None:
+        if message := self.overflow.report():
+            record = logging.makeLogRecord(
+                {
+                    "name": server_logger.name,
+                    "levelno": logging.WARNING,
+                    "levelname": "WARNING",
+                    "msg": message,
+                }
+            )
+            self.acquire()
+            try:
+                self.buffer.append(self.prepare(record))
+            finally:
+                self.release()
+
+    def emit_in_process(
+        self, batch: list[Union[LogRecord, Preformatted]]
+    ) -> None:
+        # Going through the loggers would only lead back to this handler
+        self.fallback.handle(
+            logging.makeLogRecord(
+                {
+                    "name": server_logger.name,
+                    "levelno": logging.WARNING,
+                    "levelname": "WARNING",
+                    "msg": "Background logger is full. Emitting log in "
+                    "process.",
+                }
+            )
+        )
+        for item in batch:
+            self.fallback.handle(to_record(item))
+
+
+async def flush_server_logging(app: Sanic):
+    qhandler: SanicQueueHandler = app.ctx._qhandler
+    reported = monotonic()
+    while True:
+        await sleep(app.config.LOGGING_FLUSH_INTERVAL)
+        now = monotonic()
+        if now - reported >= app.config.LOGGING_OVERFLOW_REPORT_INTERVAL:
+            qhandler.report()
+            reported = now
+        qhandler.flush()
+
+
+def get_overflow_policy(app: Sanic) -> OverflowPolicy:
+    keep_level = app.config.LOGGING_OVERFLOW_KEEP_LEVEL
+    if isinstance(keep_level, str):
+        keep_level = logging.getLevelName(keep_level.upper())
+    if not isinstance(keep_level, int):
+        raise SanicException(
+            f"Unknown LOGGING_OVERFLOW_KEEP_LEVEL: "
+            f"{app.config.LOGGING_OVERFLOW_KEEP_LEVEL}"
+        )
+    return OverflowPolicy(
+        app.config.LOGGING_OVERFLOW,
+        keep_level,
+        app.config.LOGGING_OVERFLOW_SAMPLE_RATE,
+        app.config.LOGGING_OVERFLOW_SAMPLE_RATES,
+        app.config.LOGGING_QUEUE_MAX_SIZE,
+    )
+
+
+def get_worker_formatters(app: Sanic) -> dict[str, logging.Formatter]:
+    preformat = app.config.LOGGING_PREFORMAT
+    formatters: dict[str, logging.Formatter] = {}
+    for logger_name in app.config.LOGGERS:
+        if preformat == "json":
+            formatters[logger_name] = (
+                JSONAccessFormatter()
+                if logger_name == "sanic.access"
+                else JSONFormatter()
+            )
+            continue
+        # The worker has the same logging setup as the main process, so
+        # the formatters that are about to be replaced by the queue handler
+        # are the ones that the background logger would use
+        formatters[logger_name] = next(
+            (
+                handler.formatter
+                for handler in logging.getLogger(logger_name).handlers
+                if handler.formatter
+            ),
+            logging.Formatter(),
+        )
+    return formatters
+
+
+def get_destination_levels(app: Sanic) -> dict[str, int]:
+    """
+    The lowest level that is let through by any of the handlers that a
+    record of each logger would reach in the background logger. It has the
+    same logging setup as the worker, so the handlers are looked up here
+    before the queue handler replaces them.
+    """
+    levels: dict[str, int] = {}
+    for logger_name in app.config.LOGGERS:
+        handlers = []
+        current: Optional[logging.Logger] = logging.getLogger(logger_name)
+        while current:
+            handlers.extend(current.handlers)
+            current = current.parent if current.propagate else None
+        if handlers:
+            levels[logger_name] = min(handler.level for handler in handlers)
+        else:
+            # Without any handlers, only the last resort is left
+            last_resort = logging.lastResort
+            levels[logger_name] = (
+                last_resort.level if last_resort else logging.CRITICAL + 1
+            )
+    return levels
+
 
 async def setup_server_logging(app: Sanic):
-    qhandler = SanicQueueHandler(app.shared_ctx.logger_queue)
+    qhandler = SanicQueueHandler(
+        app.shared_ctx.logger_queue,
+        app.config.LOGGING_BATCH_SIZE,
+        get_worker_formatters(app) if app.config.LOGGING_PREFORMAT else None,
+        get_destination_levels(app),
+        get_overflow_policy(app),
+    )
     app.ctx._logger_handlers = defaultdict(list)
     app.ctx._qhandler = qhandler
 
@@ -59,8 +412,12 @@ async def setup_server_logging(app: Sanic):
         logger_instance.handlers.clear()
         logger_instance.addHandler(qhandler)
 
+    app.add_task(flush_server_logging(app), name="flush_server_logging")
+
 
 async def remove_server_logging(app: Sanic):
+    app.ctx._qhandler.report()
+    app.ctx._qhandler.flush()
     for logger, handlers in app.ctx._logger_handlers.items():
         logger.removeHandler(app.ctx._qhandler)
         for handler in handlers:
@@ -76,7 +433,7 @@ class Logger:
             logger: logging.getLogger(logger) for logger in self.LOGGERS
         }
 
-    def __call__(self, queue, config) -> None:
+    def __call__(self, queue, config, preformatted: bool = False) -> None:
         signal_func(SIGINT, self.stop)
         signal_func(SIGTERM, self.stop)
 
@@ -93,13 +450,33 @@ class Logger:
                 f"Logger config not found for: {', '.join(missing)}"
             )
         setup_logging(True, no_color=False, log_extra=True)
+        if preformatted:
+            formatter = PreformattedFormatter()
+            for logger in self.loggers.values():
+                for handler in logger.handlers:
+                    handler.setFormatter(formatter)
 
         while self.run:
             try:
-                record: LogRecord = queue.get(timeout=0.05)
+                batch = queue.get(timeout=0.05)
             except Empty:
                 continue
+            self.handle(batch)
+
+        # Whatever the workers managed to send before shutting down
+        while True:
+            try:
+                self.handle(queue.get_nowait())
+            except Empty:
+                break
+
+    def handle(self, batch: list[Union[LogRecord, Preformatted]]) -> None:
+        for item in batch:
+            record = to_record(item)
             logger = self.loggers.get(record.name)
+            if logger is None:
+                # A child of one of the loggers that propagated the record
+                logger = logging.getLogger(record.name)
             logger.handle(record)
 
     def stop(self, *_):
@@ -112,15 +489,24 @@ class Logger:
 
     @classmethod
     def prepare(cls, app: Sanic):
-        sync_manager = Manager()
-        logger_queue = sync_manager.Queue(
-            maxsize=app.config.LOGGING_QUEUE_MAX_SIZE
+        # The queue holds batches, but its size is configured in records
+        logger_queue = Queue(
+            maxsize=ceil(
+                app.config.LOGGING_QUEUE_MAX_SIZE
+                / app.config.LOGGING_BATCH_SIZE
+            )
         )
         app.shared_ctx.logger_queue = logger_queue
         cls.update_cls_loggers(app.config.LOGGERS)
 
     @classmethod
     def setup(cls, app: Sanic):
+        if app.config.LOGGING_PREFORMAT not in PREFORMAT_OPTIONS:
+            raise SanicException(
+                "LOGGING_PREFORMAT must be one of: "
+                + ", ".join(repr(option) for option in PREFORMAT_OPTIONS)
+            )
+        get_overflow_policy(app)
         app.main_process_start(prepare_logger)
         app.main_process_ready(setup_logger)
         app.before_server_start(setup_server_logging)
@@ -127,7 +127,10 @@ def blueprint_factory(config: Config):
     async def spec(request: Request):
         if config.OAS_CUSTOM_FILE:
             return await file(config.OAS_CUSTOM_FILE)
-        return json(SpecificationBuilder().build(request.app).serialize())
+        specification = SpecificationBuilder()
+        if specification.is_stale(request.app):
+            build_spec(request.app)
+        return specification.serialized(request.app).respond(request)
 
     if config.OAS_UI_SWAGGER:
 
@@ -198,9 +201,9 @@ def blueprint_factory(config: Config):
                 operation._default["summary"] = clean_route_name(route_name)
 
                 if host:
-                    if "servers" not in operation._default:
-                        operation._default["servers"] = []
-                    operation._default["servers"].append({"url": f"//{host}"})
+                    servers = operation._default.setdefault("servers", [])
+                    if (server := {"url": f"//{host}"}) not in servers:
+                        servers.append(server)
 
                 for _parameter in route_parameters:
                     if any(
@@ -239,6 +242,8 @@ def blueprint_factory(config: Config):
                 specification.operation(uri, method, operation)
 
         add_static_info_to_spec_from_config(app, specification)
+        if not config.OAS_CUSTOM_FILE:
+            specification.rebuild(app)
 
     return bp
 
@@ -31,6 +31,7 @@ from .definitions import (
     Server,
     Tag,
 )
+from .document import SerializedSpecification
 
 
 if TYPE_CHECKING:
@@ -179,6 +180,8 @@ class SpecificationBuilder:
     _security: list[SecurityRequirement]
     _components: dict[str, Any]
     _servers: list[Server]
+    _documents: dict[str, SerializedSpecification]
+    _stale: set[str]
     # _components: ComponentsBuilder
     # deliberately not included
     _singleton: Optional[SpecificationBuilder] = None
@@ -194,10 +197,12 @@ class SpecificationBuilder:
         instance._components = defaultdict(dict)
         instance._contact = None
         instance._description = None
+        instance._documents = {}
         instance._external = None
         instance._license = None
         instance._paths = defaultdict(dict)
         instance._servers = []
+        instance._stale = set()
         instance._tags = {}
         instance._security = []
         instance._terms = None
@@ -218,7 +223,8 @@ class SpecificationBuilder:
         return self._security
 
     def url(self, value: str):
-        self._urls.append(value)
+        if value not in self._urls:
+            self._urls.append(value)
 
     def describe(
         self,
@@ -405,6 +411,34 @@ class SpecificationBuilder:
             externalDocs=self._external,
         )
 
+    def serialized(self, app: Sanic) -> SerializedSpecification:
+        if (document := self._documents.get(app.name)) is None:
+            document = self.rebuild(app)
+        return document
+
+    def rebuild(self, app: Sanic) -> SerializedSpecification:
+        """
+        Build and cache the serialized document for an application,
+        replacing any previous one.
+        """
+        document = SerializedSpecification(self.build(app).serialize())
+        self._documents[app.name] = document
+        self._stale.discard(app.name)
+        return document
+
+    def is_stale(self, app: Sanic) -> bool:
+        return app.name in self._stale
+
+    def invalidate(self, app: Sanic) -> None:
+        """
+        Discard the cached document for an application. The next request
+        for the specification will rescan the application routes and
+        rebuild the document. Use this after adding routes or otherwise
+        changing the specification once the server is running.
+        """
+        self._documents.pop(app.name, None)
+        self._stale.add(app.name)
+
     def _build_info(self) -> Info:
         kwargs = remove_nulls(
             {
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import gzip
+
+from hashlib import sha256
+from typing import Any
+
+from sanic import Request
+from sanic.response import HTTPResponse, json
+
+
+try:
+    import brotli
+
+    BROTLI_ENABLED = True
+except (ImportError, ModuleNotFoundError):
+    BROTLI_ENABLED = False
+
+
+class SerializedSpecification:
+    """
+    A pre-encoded OpenAPI document that can be served repeatedly without
+    rebuilding or re-encoding the specification tree.
+    """
+
+    __slots__ = ("body", "etag", "variants")
+
+    def __init__(self, spec: dict[str, Any]):
+        self.body: bytes = json(spec).body or b""
+        digest = sha256(self.body).hexdigest()[:32]
+        self.etag = f'"{digest}"'
+        self.variants: dict[str, tuple[bytes, str]] = {
+            "gzip": (gzip.compress(self.body), f'"{digest}-gzip"'),
+        }
+        if BROTLI_ENABLED:
+            self.variants["br"] = (
+                brotli.compress(self.body),
+                f'"{digest}-br"',
+            )
+
+    def respond(self, request: Request) -> HTTPResponse:
+        encoding = self._negotiate(request.headers.get("accept-encoding", ""))
+        body, etag = (
+            self.variants[encoding] if encoding else (self.body, self.etag)
+        )
+        headers = {"etag": etag, "vary": "accept-encoding"}
+
+        if self._is_fresh(request.headers.get("if-none-match")):
+            return HTTPResponse(status=304, headers=headers)
+
+        if encoding:
+            headers["content-encoding"] = encoding
+
+        return HTTPResponse(
+            body, headers=headers, content_type="application/json"
+        )
+
+    def _negotiate(self, accept_encoding: str) -> str:
+        accepted = set()
+        for item in accept_encoding.split(","):
+            coding, _, params = item.strip().partition(";")
+            if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00"):
+                continue
+            accepted.add(coding.strip().lower())
+
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and encoding in accepted:
+                return encoding
+        return ""
+
+    def _is_fresh(self, if_none_match: str | None) -> bool:
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        etags = {self.etag, *(etag for _, etag in self.variants.values())}
+        return any(
+            tag.strip().removeprefix("W/") in etags
+            for tag in if_none_match.split(",")
+        )
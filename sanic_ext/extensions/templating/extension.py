@@ -5,14 +5,19 @@ import os
 from collections import abc
 from collections.abc import Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING, Union
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from jinja2 import (
+    BytecodeCache,
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
+    TemplateError,
     __version__,
     select_autoescape,
 )
+from sanic.log import logger
 
 from sanic_ext.extensions.templating.engine import Templating
 
@@ -23,6 +28,47 @@ if TYPE_CHECKING:
     from sanic_ext import Extend
 
 
+def get_bytecode_cache(value: Any) -> Optional[BytecodeCache]:
+    """
+    The bytecode cache for ``TEMPLATING_BYTECODE_CACHE``, which can be a
+    directory, ``True`` for a directory in the temp directory of the user,
+    or a ``jinja2.BytecodeCache`` instance.
+    """
+    if not value:
+        return None
+    if isinstance(value, BytecodeCache):
+        return value
+    if value is True:
+        return FileSystemBytecodeCache()
+    directory = Path(value)
+    directory.mkdir(parents=True, exist_ok=True)
+    # Entries are written to a temporary file that is then moved into
+    # place, so workers never read one that is only partly written
+    return FileSystemBytecodeCache(str(directory))
+
+
+def precompile_templates(environment: Environment) -> None:
+    start = perf_counter()
+    try:
+        names = environment.list_templates()
+    except TypeError:
+        logger.debug("The template loader cannot list templates to compile")
+        return
+
+    compiled = 0
+    for name in names:
+        try:
+            environment.get_template(name)
+        except (TemplateError, UnicodeDecodeError) as e:
+            logger.debug(f"Could not precompile template {name}: {e}")
+        else:
+            compiled += 1
+    logger.debug(
+        f"Precompiled {compiled} templates in "
+        f"{(perf_counter() - start) * 1000:.1f}ms"
+    )
+
+
 class TemplatingExtension(Extension):
     name = "templating"
 
@@ -31,18 +77,33 @@ class TemplatingExtension(Extension):
             self.config.TEMPLATING_PATH_TO_TEMPLATES
         )
         loader = FileSystemLoader(self.config.TEMPLATING_PATH_TO_TEMPLATES)
+        bytecode_cache = get_bytecode_cache(
+            self.config.TEMPLATING_BYTECODE_CACHE
+        )
 
         if not hasattr(bootstrap, "environment"):
             bootstrap.environment = Environment(
                 loader=loader,
                 autoescape=select_autoescape(),
                 enable_async=self.config.TEMPLATING_ENABLE_ASYNC,
+                bytecode_cache=bytecode_cache,
             )
         if not hasattr(bootstrap, "templating"):
             bootstrap.templating = Templating(
                 environment=bootstrap.environment, config=self.config
             )
-        bootstrap.templating.environment.globals["url_for"] = self.app.url_for
+        environment = bootstrap.templating.environment
+        environment.globals["url_for"] = self.app.url_for
+
+        if bytecode_cache:
+            if environment.bytecode_cache is None:
+                environment.bytecode_cache = bytecode_cache
+
+            # Compiling every template once before the workers start means
+            # that they all load bytecode instead of each compiling it
+            @self.app.main_process_start
+            async def _precompile_templates(app, *_):
+                precompile_templates(environment)
 
     def label(self):
         return f"jinja2=={__version__}"
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, TypeVar
+
+from .validators import VALIDATION_ERROR
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchError:
+    index: int
+    error: str
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    """
+    The outcome of validating every item of a list payload. ``items`` holds
+    the valid items, ``indices`` their positions in the payload, and
+    ``errors`` the items that were rejected.
+    """
+
+    items: list[T] = field(default_factory=list)
+    indices: list[int] = field(default_factory=list)
+    errors: list[BatchError] = field(default_factory=list)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "accepted": self.indices,
+            "rejected": [
+                {"index": error.index, "error": error.error}
+                for error in self.errors
+            ],
+        }
+
+
+def validate_batch(
+    validator: Callable[[type[T], Any], T],
+    model: type[T],
+    data: Iterable[Any],
+) -> BatchResult[T]:
+    """
+    Validate every item instead of stopping at the first invalid one, so
+    that a client can be told exactly which items were rejected.
+    """
+    result: BatchResult[T] = BatchResult()
+    for index, item in enumerate(data):
+        try:
+            value = validator(model, item)
+        except VALIDATION_ERROR as e:
+            result.errors.append(BatchError(index, str(e)))
+        else:
+            result.items.append(value)
+            result.indices.append(index)
+    return result
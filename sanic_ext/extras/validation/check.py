@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import _HAS_DEFAULT_FACTORY  # type: ignore
+from inspect import Parameter
 from typing import (
     Any,
+    Callable,
     Literal,
     NamedTuple,
     Optional,
@@ -21,6 +23,7 @@ from sanic_ext.utils.typing import (
 
 
 MISSING: tuple[Any, ...] = (_HAS_DEFAULT_FACTORY,)
+_EMPTY = Parameter.empty
 
 try:
     import attrs  # noqa
@@ -43,6 +46,9 @@ except ImportError:
     MSGSPEC = False
 
 
+Validator = Callable[[Any], Any]
+
+
 class Hint(NamedTuple):
     hint: Any
     model: bool
@@ -56,99 +62,14 @@ class Hint(NamedTuple):
     def validate(
         self, value, schema, allow_multiple=False, allow_coerce=False
     ):
-        if not self.typed:
-            if self.model:
-                return check_data(
-                    self.hint,
-                    value,
-                    schema,
-                    allow_multiple=allow_multiple,
-                    allow_coerce=allow_coerce,
-                )
-
-            if (
-                allow_multiple
-                and isinstance(value, list)
-                and self.coerce_type is not list
-                and len(value) == 1
-            ):
-                value = value[0]
-            try:
-                _check_types(value, self.literal, self.hint)
-            except ValueError as e:
-                if allow_coerce:
-                    value = self.coerce(value)
-                    _check_types(value, self.literal, self.hint)
-                else:
-                    raise e
-        else:
-            value = _check_nullability(
-                value,
-                self.nullable,
-                self.allowed,
-                schema,
-                allow_multiple,
-                allow_coerce,
-            )
-
-            if not self.nullable:
-                if self.origin in (Union, Literal, UnionType):
-                    value = _check_inclusion(
-                        value,
-                        self.allowed,
-                        schema,
-                        allow_multiple,
-                        allow_coerce,
-                    )
-                elif self.origin is list:
-                    value = _check_list(
-                        value,
-                        self.allowed,
-                        self.hint,
-                        schema,
-                        allow_multiple,
-                        allow_coerce,
-                    )
-                elif self.origin is dict:
-                    value = _check_dict(
-                        value,
-                        self.allowed,
-                        self.hint,
-                        schema,
-                        allow_multiple,
-                        allow_coerce,
-                    )
-
-            if allow_coerce:
-                value = self.coerce(value)
-
-        return value
+        """
+        Validate a single value. This compiles the hint on every call, so
+        use compile_hint to validate more than one value.
+        """
+        return compile_hint(self, schema, allow_multiple, allow_coerce)(value)
 
     def coerce(self, value):
-        if is_generic(self.coerce_type):
-            args = get_args(self.coerce_type)
-            if get_origin(self.coerce_type) == Literal or (
-                all(get_origin(arg) == Literal for arg in args)
-            ):
-                return value
-            if type(None) in args and value is None:
-                return None
-            coerce_types = [arg for arg in args if not isinstance(None, arg)]
-        else:
-            coerce_types = [self.coerce_type]
-        for coerce_type in coerce_types:
-            try:
-                if isinstance(value, list):
-                    value = [coerce_type(item) for item in value]
-                elif value is None and self.nullable:
-                    value = None
-                else:
-                    value = coerce_type(value)
-            except (ValueError, TypeError):
-                ...
-            else:
-                return value
-        return value
+        return _compile_coerce(self)(value)
 
     @property
     def coerce_type(self):
@@ -159,33 +80,128 @@ class Hint(NamedTuple):
 
 
 def check_data(model, data, schema, allow_multiple=False, allow_coerce=False):
-    if not isinstance(data, dict):
-        raise TypeError(f"Value '{data}' is not a dict")
+    return model_validator(model, schema, allow_multiple, allow_coerce)(data)
+
+
+def model_validator(
+    model, schema, allow_multiple=False, allow_coerce=False
+) -> Validator:
+    """
+    Get the compiled validator for a model, compiling it on first use. The
+    validator is cached on the schema for each combination of options.
+    """
+    validators = schema[model.__name__].setdefault("validators", {})
+    key = (bool(allow_multiple), bool(allow_coerce))
+    if (validator := validators.get(key)) is None:
+        validator = validators[key] = _compile_model(model, schema, *key)
+    return validator
+
+
+def _compile_model(model, schema, allow_multiple, allow_coerce) -> Validator:
     sig = schema[model.__name__]["sig"]
     hints = schema[model.__name__]["hints"]
-    bound = sig.bind(**data)
-    bound.apply_defaults()
-    params = dict(zip(sig.parameters, bound.args))
-    params.update(bound.kwargs)
+    fields = {
+        key: (
+            compile_hint(hint, schema, allow_multiple, allow_coerce),
+            hint.allow_missing,
+        )
+        for key, hint in hints.items()
+    }
+    convert = (
+        _compile_msgspec_convert(model)
+        if MSGSPEC and is_msgspec(model)
+        else None
+    )
+    params = schema[model.__name__].get("params")
+    if params is None:
+        return _compile_bound_model(model, sig, fields, convert)
+
+    names = frozenset(name for name, _ in params)
+    required = tuple(name for name, default in params if default is _EMPTY)
+    plan = tuple(
+        (
+            name,
+            default,
+            *fields.get(name, (_passthrough, False)),
+        )
+        for name, default in params
+    )
+    # Fields whose default is a factory are left to the model to build
+    # when they are not in the data
+    skip = frozenset(
+        name
+        for name, default, _, allow_missing in plan
+        if allow_missing and default in MISSING
+    )
 
-    hydration_values = {}
-    try:
-        for key, value in params.items():
-            hint = hints.get(key, Any)
-            try:
-                hydration_values[key] = hint.validate(
-                    value,
-                    schema,
-                    allow_multiple=allow_multiple,
-                    allow_coerce=allow_coerce,
-                )
-            except ValueError:
-                if not hint.allow_missing or value not in MISSING:
-                    raise
-    except ValueError as e:
-        raise TypeError(e)
-
-    if MSGSPEC and is_msgspec(model):
+    def validate(data):
+        if not isinstance(data, dict):
+            raise TypeError(f"Value '{data}' is not a dict")
+        for name in required:
+            if name not in data:
+                raise TypeError(f"missing a required argument: '{name}'")
+        if not names.issuperset(data):
+            unexpected = next(key for key in data if key not in names)
+            raise TypeError(
+                f"got an unexpected keyword argument '{unexpected}'"
+            )
+
+        hydration_values = {}
+        try:
+            for key, default, validator, allow_missing in plan:
+                if key in data:
+                    value = data[key]
+                elif key in skip:
+                    continue
+                else:
+                    value = default
+                try:
+                    hydration_values[key] = validator(value)
+                except ValueError:
+                    if not allow_missing or value not in MISSING:
+                        raise
+        except ValueError as e:
+            raise TypeError(e)
+
+        if convert:
+            return convert(hydration_values)
+        return model(**hydration_values)
+
+    return validate
+
+
+def _compile_bound_model(model, sig, fields, convert) -> Validator:
+    unknown = (_passthrough, False)
+
+    def validate(data):
+        if not isinstance(data, dict):
+            raise TypeError(f"Value '{data}' is not a dict")
+        bound = sig.bind(**data)
+        bound.apply_defaults()
+        params = dict(zip(sig.parameters, bound.args))
+        params.update(bound.kwargs)
+
+        hydration_values = {}
+        try:
+            for key, value in params.items():
+                validator, allow_missing = fields.get(key, unknown)
+                try:
+                    hydration_values[key] = validator(value)
+                except ValueError:
+                    if not allow_missing or value not in MISSING:
+                        raise
+        except ValueError as e:
+            raise TypeError(e)
+
+        if convert:
+            return convert(hydration_values)
+        return model(**hydration_values)
+
+    return validate
+
+
+def _compile_msgspec_convert(model) -> Validator:
+    def convert(hydration_values):
         try:
             return msgspec.convert(hydration_values, model, str_keys=True)
         except AttributeError:
@@ -194,90 +210,327 @@ def check_data(model, data, schema, allow_multiple=False, allow_coerce=False):
             )
         except msgspec.ValidationError as e:
             raise TypeError(e)
-    else:
-        return model(**hydration_values)
 
+    return convert
+
+
+def compile_hint(
+    hint: Hint, schema, allow_multiple=False, allow_coerce=False
+) -> Validator:
+    """
+    Compile a Hint into a validator function for the given options. All of
+    the decisions that only depend upon the hint are made here, once,
+    rather than on every call.
+    """
+    if not hint.typed:
+        if hint.model:
+            return _compile_model_reference(
+                hint.hint, schema, allow_multiple, allow_coerce
+            )
+        return _compile_untyped(hint, allow_multiple, allow_coerce)
+
+    nullable = hint.nullable
+    coerce = _compile_coerce(hint) if allow_coerce else None
+    check: Optional[Validator] = None
+    if nullable:
+        check = _compile_nullable(hint, schema, allow_multiple, allow_coerce)
+    elif hint.origin in (Union, Literal, UnionType):
+        check = _compile_inclusion(
+            hint.allowed, schema, allow_multiple, allow_coerce
+        )
+    elif hint.origin is list:
+        check = _compile_list(hint, schema, allow_multiple, allow_coerce)
+    elif hint.origin is dict:
+        check = _compile_dict(hint, schema, allow_multiple, allow_coerce)
+
+    def validate(value):
+        if value is None:
+            if not nullable:
+                raise ValueError("Value cannot be None")
+        elif check:
+            value = check(value)
+        if coerce:
+            value = coerce(value)
+        return value
+
+    return validate
+
+
+def _compile_model_reference(
+    model, schema, allow_multiple, allow_coerce
+) -> Validator:
+    # Resolved on first call since models may reference themselves
+    validator: Optional[Validator] = None
+
+    def validate(value):
+        nonlocal validator
+        if validator is None:
+            validator = model_validator(
+                model, schema, allow_multiple, allow_coerce
+            )
+        return validator(value)
+
+    return validate
+
+
+def _compile_untyped(hint: Hint, allow_multiple, allow_coerce) -> Validator:
+    check = _compile_check_types(hint.literal, hint.hint)
+    coerce = _compile_coerce(hint) if allow_coerce else None
+    unwrap = allow_multiple and hint.coerce_type is not list
+
+    if not unwrap and not coerce:
+        return _identity_after(check)
+
+    def validate(value):
+        if unwrap and isinstance(value, list) and len(value) == 1:
+            value = value[0]
+        try:
+            check(value)
+        except ValueError:
+            if not coerce:
+                raise
+            value = coerce(value)
+            check(value)
+        return value
+
+    return validate
+
+
+def _identity_after(check: Callable[[Any], None]) -> Validator:
+    def validate(value):
+        check(value)
+        return value
+
+    return validate
 
-def _check_types(value, literal, expected):
+
+def _compile_check_types(literal, expected) -> Callable[[Any], None]:
     if literal:
         if expected is Any:
-            return
-        elif value != expected:
-            raise ValueError(f"Value '{value}' must be {expected}")
-    else:
-        if MSGSPEC and is_msgspec(expected) and isinstance(value, Mapping):
-            try:
-                expected(**value)
-            except (TypeError, msgspec.ValidationError):
+            return _passthrough
+
+        def check_literal(value):
+            if value != expected:
+                raise ValueError(f"Value '{value}' must be {expected}")
+
+        return check_literal
+
+    if MSGSPEC and is_msgspec(expected):
+
+        def check_msgspec(value):
+            if isinstance(value, Mapping):
+                try:
+                    expected(**value)
+                except (TypeError, msgspec.ValidationError):
+                    raise ValueError(
+                        f"Value '{value}' is not of type {expected}"
+                    )
+            elif not isinstance(value, expected):
                 raise ValueError(f"Value '{value}' is not of type {expected}")
-        elif not isinstance(value, expected):
+
+        return check_msgspec
+
+    def check_instance(value):
+        if not isinstance(value, expected):
             raise ValueError(f"Value '{value}' is not of type {expected}")
 
+    return check_instance
+
+
+def _compile_coerce(hint: Hint) -> Validator:
+    try:
+        coerce_type = hint.coerce_type
+        none_allowed = False
+        if is_generic(coerce_type):
+            args = get_args(coerce_type)
+            if get_origin(coerce_type) == Literal or (
+                all(get_origin(arg) == Literal for arg in args)
+            ):
+                return _passthrough
+            none_allowed = type(None) in args
+            coerce_types = [arg for arg in args if not isinstance(None, arg)]
+        else:
+            coerce_types = [coerce_type]
+    except TypeError as e:
+        # Some hints cannot be introspected ahead of time, so raise at the
+        # point where the value would otherwise have been coerced
+        message = str(e)
+
+        def coerce_error(value):
+            raise TypeError(message)
+
+        return coerce_error
+
+    nullable = hint.nullable
+
+    def coerce(value):
+        if none_allowed and value is None:
+            return None
+        for coerce_type in coerce_types:
+            try:
+                if isinstance(value, list):
+                    value = [coerce_type(item) for item in value]
+                elif value is None and nullable:
+                    value = None
+                else:
+                    value = coerce_type(value)
+            except (ValueError, TypeError):
+                ...
+            else:
+                return value
+        return value
 
-def _check_nullability(
-    value, nullable, allowed, schema, allow_multiple, allow_coerce
-):
-    if not nullable and value is None:
-        raise ValueError("Value cannot be None")
-    if nullable and value is not None:
+    return coerce
+
+
+def _compile_nullable(
+    hint: Hint, schema, allow_multiple, allow_coerce
+) -> Validator:
+    allowed = [
+        compile_hint(option, schema, allow_multiple, allow_coerce)
+        for option in hint.allowed
+    ]
+    options = ", ".join([str(option.hint) for option in hint.allowed])
+    single = len(allowed) == 1
+
+    def validate(value):
         exc = None
-        for hint in allowed:
+        for validator in allowed:
             try:
-                value = hint.validate(
-                    value, schema, allow_multiple, allow_coerce
-                )
+                return validator(value)
             except ValueError as e:
                 exc = e
-            else:
-                break
-        else:
-            if exc:
-                if len(allowed) == 1:
-                    raise exc
-                else:
-                    options = ", ".join(
-                        [str(option.hint) for option in allowed]
-                    )
-                    raise ValueError(
-                        f"Value '{value}' must be one of {options}, or None"
-                    )
-    return value
+        if exc:
+            if single:
+                raise exc
+            raise ValueError(
+                f"Value '{value}' must be one of {options}, or None"
+            )
+        return value
 
+    return validate
 
-def _check_inclusion(value, allowed, schema, allow_multiple, allow_coerce):
-    for option in allowed:
-        try:
-            return option.validate(value, schema, allow_multiple, allow_coerce)
-        except (ValueError, TypeError):
-            ...
 
+def _compile_inclusion(
+    allowed: tuple[Hint, ...], schema, allow_multiple, allow_coerce
+) -> Validator:
     options = ", ".join([str(option.hint) for option in allowed])
-    raise ValueError(f"Value '{value}' must be one of {options}")
+    steps = _compile_dispatch(allowed, schema, allow_multiple, allow_coerce)
 
+    if len(steps) == 1 and isinstance(steps[0], tuple):
+        # The most common case: a union of plain types, such as
+        # Union[int, str] or Optional[str], can be checked in one call.
+        classes = steps[0]
 
-def _check_list(value, allowed, hint, schema, allow_multiple, allow_coerce):
-    if isinstance(value, list):
-        try:
-            return [
-                _check_inclusion(
-                    item, allowed, schema, allow_multiple, allow_coerce
-                )
-                for item in value
-            ]
-        except (ValueError, TypeError):
-            ...
-    raise ValueError(f"Value '{value}' must be a {hint}")
-
-
-def _check_dict(value, allowed, hint, schema, allow_multiple, allow_coerce):
-    if isinstance(value, dict):
+        def validate_instance(value):
+            if isinstance(value, classes):
+                return value
+            raise ValueError(f"Value '{value}' must be one of {options}")
+
+        return validate_instance
+
+    def validate(value):
+        for step in steps:
+            if isinstance(step, tuple):
+                if isinstance(value, step):
+                    return value
+            elif isinstance(step, frozenset):
+                try:
+                    if value in step:
+                        return value
+                except TypeError:
+                    ...
+            else:
+                try:
+                    return step(value)
+                except (ValueError, TypeError):
+                    ...
+        raise ValueError(f"Value '{value}' must be one of {options}")
+
+    return validate
+
+
+def _compile_dispatch(
+    allowed: tuple[Hint, ...], schema, allow_multiple, allow_coerce
+) -> list[Any]:
+    """
+    Turn the options of a union into a sequence of steps to try in order.
+    Options that can only accept a value unchanged, based solely upon its
+    type or equality, are merged into a single isinstance() tuple or
+    membership check. Any other option remains its own validator.
+    """
+    steps: list[Any] = []
+    simple = not allow_multiple and not allow_coerce
+    for option in allowed:
+        if simple and (kind := _dispatch_kind(option)):
+            value = option.hint
+            if steps and type(steps[-1]) is kind:
+                value = kind((*steps[-1], value))
+                steps[-1] = value
+            else:
+                steps.append(kind((value,)))
+            continue
+        steps.append(
+            compile_hint(option, schema, allow_multiple, allow_coerce)
+        )
+    return steps
+
+
+def _dispatch_kind(option: Hint) -> Optional[type]:
+    if option.typed or option.model:
+        return None
+    if option.literal:
         try:
-            return {
-                key: _check_inclusion(
-                    item, allowed, schema, allow_multiple, allow_coerce
-                )
-                for key, item in value.items()
-            }
-        except (ValueError, TypeError):
-            ...
-    raise ValueError(f"Value '{value}' must be a {hint}")
+            hash(option.hint)
+        except TypeError:
+            return None
+        return frozenset if option.hint is not Any else None
+    try:
+        isinstance(None, option.hint)
+    except TypeError:
+        return None
+    if MSGSPEC and is_msgspec(option.hint):
+        return None
+    return tuple
+
+
+def _compile_list(
+    hint: Hint, schema, allow_multiple, allow_coerce
+) -> Validator:
+    include = _compile_inclusion(
+        hint.allowed, schema, allow_multiple, allow_coerce
+    )
+    expected = hint.hint
+
+    def validate(value):
+        if isinstance(value, list):
+            try:
+                return [include(item) for item in value]
+            except (ValueError, TypeError):
+                ...
+        raise ValueError(f"Value '{value}' must be a {expected}")
+
+    return validate
+
+
+def _compile_dict(
+    hint: Hint, schema, allow_multiple, allow_coerce
+) -> Validator:
+    include = _compile_inclusion(
+        hint.allowed, schema, allow_multiple, allow_coerce
+    )
+    expected = hint.hint
+
+    def validate(value):
+        if isinstance(value, dict):
+            try:
+                return {key: include(item) for key, item in value.items()}
+            except (ValueError, TypeError):
+                ...
+        raise ValueError(f"Value '{value}' must be a {expected}")
+
+    return validate
+
+
+def _passthrough(value):
+    return value
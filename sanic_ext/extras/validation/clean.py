@@ -1,39 +1,48 @@
-from typing import Any, Optional, Type, get_origin, get_type_hints
+from typing import Any, get_origin, get_type_hints
+from weakref import WeakKeyDictionary
 
-import pydantic
+from sanic_ext.utils.typing import is_pydantic
 
 
 def clean_data(
     model: type[object],
     data: dict[str, Any],
 ) -> dict[str, Any]:
-    if isinstance(model, pydantic.BaseModel):
-        hints: dict[str, type] = {}
-        for key, field in model.__annotations__.items():
-            hints[key] = field.annotation
-            if alias := (
-                getattr(field, "validation_alias", None)
-                or getattr(field, "alias", None)
-            ):
-                hints[alias] = field.annotation
-        hints = {
-            key: field.annotation
-            for key, field in model.__annotations__.items()
-        }
-    else:
-        hints = get_type_hints(model)
+    if (list_fields := _list_fields_cache.get(model)) is None:
+        list_fields = _list_fields_cache[model] = _list_fields(model)
     return {
-        key: _coerce(hints.get(key, None), value)
-        for key, value in data.items()
+        key: _coerce(key in list_fields, value) for key, value in data.items()
     }
 
 
-def _coerce(param_type: Optional[Type], value: Any) -> Any:
-    if (
-        get_origin(param_type) is not list
-        and isinstance(value, list)
-        and len(value) == 1
-    ):
+# Held weakly so that models that are created at runtime can be freed
+_list_fields_cache: WeakKeyDictionary[type[object], frozenset[str]] = (
+    WeakKeyDictionary()
+)
+
+
+def _list_fields(model: type[object]) -> frozenset[str]:
+    """
+    The names, including any pydantic aliases, of the fields on a model
+    that expect a list. Every other field takes a single value.
+    """
+    hints: dict[str, Any] = get_type_hints(model)
+    if is_pydantic(model) and (fields := getattr(model, "model_fields", None)):
+        for key, field in fields.items():
+            hints[key] = field.annotation
+            for alias in (
+                getattr(field, "validation_alias", None),
+                getattr(field, "alias", None),
+            ):
+                if isinstance(alias, str):
+                    hints[alias] = field.annotation
+    return frozenset(
+        key for key, hint in hints.items() if get_origin(hint) is list
+    )
+
+
+def _coerce(is_list: bool, value: Any) -> Any:
+    if not is_list and isinstance(value, list) and len(value) == 1:
         value = value[0]
 
     return value
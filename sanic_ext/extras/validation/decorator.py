@@ -1,5 +1,5 @@
 from functools import wraps
-from inspect import isawaitable
+from inspect import isawaitable, isclass
 from typing import Callable, Optional, TypeVar, Union
 
 from sanic import Request
@@ -7,7 +7,15 @@ from sanic import Request
 from sanic_ext.exceptions import InitError
 from sanic_ext.utils.extraction import extract_request
 
-from .setup import do_validation, generate_schema
+from .setup import (
+    do_batch_validation,
+    do_json_validation,
+    do_stream_validation,
+    do_validation,
+    generate_schema,
+)
+from .stream import stream_item_model
+from .validators import make_json_decoder
 
 
 T = TypeVar("T")
@@ -20,7 +28,23 @@ def validate(
     body_argument: str = "body",
     query_argument: str = "query",
     strict: bool | None = None,
+    stream: bool = False,
+    batch: bool = False,
+    partial: bool = False,
 ) -> Callable[[T], T]:
+    if stream and batch:
+        raise InitError("Cannot use both stream and batch validation")
+    if partial and not batch:
+        raise InitError("Partial results are only available for batches")
+    if stream or batch:
+        json = stream_item_model(json)
+        if form or not isclass(json):
+            mode = "stream" if stream else "batch"
+            raise InitError(
+                "Streaming and batch validation require a json model, for "
+                f"example validate(json=list[Item], {mode}=True)"
+            )
+
     schemas = {
         key: generate_schema(param)
         for key, param in (
@@ -33,21 +57,41 @@ def validate(
     if json and form:
         raise InitError("Cannot define both a form and json route validator")
 
+    json_decoder = make_json_decoder(json, strict) if isclass(json) else None
+
     def decorator(f):
         @wraps(f)
         async def decorated_function(*args, **kwargs):
             request = extract_request(*args)
 
-            if schemas["json"]:
-                await do_validation(
+            if schemas["json"] and stream:
+                await do_stream_validation(
+                    model=json,
+                    decoder=json_decoder,
+                    schema=schemas["json"],
+                    request=request,
+                    kwargs=kwargs,
+                    body_argument=body_argument,
+                    strict=strict,
+                )
+            elif schemas["json"] and batch:
+                await do_batch_validation(
+                    model=json,
+                    schema=schemas["json"],
+                    request=request,
+                    kwargs=kwargs,
+                    body_argument=body_argument,
+                    allow_partial=partial,
+                    strict=strict,
+                )
+            elif schemas["json"]:
+                await do_json_validation(
                     model=json,
-                    data=request.json,
+                    decoder=json_decoder,
                     schema=schemas["json"],
                     request=request,
                     kwargs=kwargs,
                     body_argument=body_argument,
-                    allow_multiple=False,
-                    allow_coerce=False,
                     strict=strict,
                 )
             elif schemas["form"]:
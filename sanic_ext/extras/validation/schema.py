@@ -1,7 +1,7 @@
 import types
 
 from dataclasses import MISSING, Field, is_dataclass
-from inspect import isclass, signature
+from inspect import Parameter, Signature, isclass, signature
 from typing import (
     Any,
     Literal,
@@ -58,6 +58,7 @@ def make_schema(agg, item):
 
         agg[item.__name__] = {
             "sig": sig,
+            "params": parse_params(sig),
             "hints": hints,
         }
 
@@ -67,6 +68,24 @@ def make_schema(agg, item):
     return agg
 
 
+def parse_params(sig: Signature) -> Optional[tuple[tuple[str, Any], ...]]:
+    """
+    The name and default of each parameter of a model's signature, in
+    order, so that data can be hydrated without Signature.bind. Models
+    with positional-only or variadic parameters return None and fall back
+    to binding the signature.
+    """
+    params = []
+    for param in sig.parameters.values():
+        if param.kind not in (
+            Parameter.POSITIONAL_OR_KEYWORD,
+            Parameter.KEYWORD_ONLY,
+        ):
+            return None
+        params.append((param.name, param.default))
+    return tuple(params)
+
+
 def parse_hints(
     hints, fields: dict[str, Union[Field, Attribute]]
 ) -> dict[str, Hint]:
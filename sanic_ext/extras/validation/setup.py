@@ -6,8 +6,11 @@ from sanic.log import logger
 from sanic_ext.exceptions import ValidationError
 from sanic_ext.utils.typing import is_msgspec, is_pydantic
 
+from .batch import validate_batch
 from .schema import make_schema
+from .stream import stream_validated
 from .validators import (
+    MalformedJSON,
     _msgspec_validate_instance,
     _validate_annotations,
     _validate_instance,
@@ -15,6 +18,108 @@ from .validators import (
 )
 
 
+async def do_json_validation(
+    *,
+    model,
+    decoder,
+    schema,
+    request,
+    kwargs,
+    body_argument,
+    strict=True,
+):
+    """
+    Validate a JSON body. When there is a decoder for the model the raw body
+    is decoded directly into it. Otherwise, or when the body is not valid
+    JSON, fall back to validating request.json so that errors are reported
+    the same way as for any other model.
+    """
+    if decoder and request.parsed_json is None and request.body:
+        logger.debug(f"Validating {request.path} using {model}")
+        try:
+            kwargs[body_argument] = validate_body(decoder, model, request.body)
+        except MalformedJSON:
+            ...
+        else:
+            return
+
+    await do_validation(
+        model=model,
+        data=request.json,
+        schema=schema,
+        request=request,
+        kwargs=kwargs,
+        body_argument=body_argument,
+        allow_multiple=False,
+        allow_coerce=False,
+        strict=strict,
+    )
+
+
+async def do_batch_validation(
+    *,
+    model,
+    schema,
+    request,
+    kwargs,
+    body_argument,
+    allow_partial=False,
+    strict=True,
+):
+    """
+    Validate each item of a list body, collecting the errors of all the
+    invalid items. Unless partial results are allowed, any invalid item
+    fails the request with a report of every rejected index.
+    """
+    logger.debug(f"Batch validating {request.path} using {model}")
+    data = request.json
+    if not isinstance(data, list):
+        raise ValidationError(
+            f"Invalid request body: expected a list of {model.__name__}"
+        )
+
+    validator = _get_validator(model, schema, False, False, strict)
+    result = validate_batch(validator, model, data)
+    if not allow_partial:
+        if result.errors:
+            raise ValidationError(
+                f"Invalid request body: {len(result.errors)} of "
+                f"{len(data)} {model.__name__} items are invalid",
+                context={"rejected": result.report()["rejected"]},
+            )
+        kwargs[body_argument] = result.items
+    else:
+        kwargs[body_argument] = result
+
+
+async def do_stream_validation(
+    *,
+    model,
+    decoder,
+    schema,
+    request,
+    kwargs,
+    body_argument,
+    strict=True,
+):
+    """
+    Pass the handler an async iterator of validated items instead of a
+    fully decoded body. The items are read from a JSON array, or from an
+    NDJSON body, and are validated one at a time while the body streams in.
+    """
+    validator = (
+        None
+        if decoder
+        else _get_validator(model, schema, False, False, strict)
+    )
+    kwargs[body_argument] = stream_validated(
+        model=model,
+        decoder=decoder,
+        validator=validator,
+        request=request,
+    )
+
+
 async def do_validation(
     *,
     model,
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import re
+
+from collections.abc import AsyncIterator
+from json import loads
+from typing import Any, Callable, Optional, get_args, get_origin
+
+from sanic import Request
+from sanic.exceptions import BadRequest, PayloadTooLarge
+from sanic.log import logger
+
+from sanic_ext.exceptions import ValidationError
+
+from .validators import VALIDATION_ERROR, MalformedJSON
+
+
+NDJSON_TYPES = (
+    "application/x-ndjson",
+    "application/ndjson",
+    "application/jsonl",
+    "application/x-jsonlines",
+)
+
+MAX_ITEM_SIZE = 100_000_000
+
+
+def stream_item_model(model: Any) -> Any:
+    """
+    The model of each item in a streamed or batched body. Both
+    ``list[Item]`` and ``Item`` mean a body made up of ``Item`` objects.
+    """
+    if get_origin(model) is list and (args := get_args(model)):
+        return args[0]
+    return model
+
+
+class JSONArraySplitter:
+    """
+    Incrementally split a JSON array into the raw bytes of its items. Only
+    the item that is currently being received is kept in memory, and it may
+    not grow beyond ``max_size`` bytes. The items are not decoded here,
+    only delimited, so a malformed item is left for the decoder to reject.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_depth",
+        "_done",
+        "_expect_item",
+        "_max_size",
+        "_pos",
+    )
+
+    # Whole strings are matched in one go so that brackets and commas
+    # inside of them are skipped. A lone quote is a string that has not
+    # been fully received yet.
+    TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{},"]', re.S)
+
+    def __init__(self, max_size: int = MAX_ITEM_SIZE) -> None:
+        self._buffer = bytearray()
+        self._depth = 0
+        self._done = False
+        self._expect_item = False
+        self._max_size = max_size
+        self._pos = 0
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        buffer = self._buffer
+        buffer += chunk
+        items: list[bytes] = []
+        start = 0
+        pos = len(buffer)
+
+        for match in self.TOKEN.finditer(buffer, self._pos):
+            token = match.group()
+            if token == b'"':
+                pos = match.start()
+                break
+
+            char = token[0]
+            if self._depth == 0:
+                if (
+                    self._done
+                    or char != ord("[")
+                    or buffer[start : match.start()].strip()
+                ):
+                    raise MalformedJSON("Expected a JSON array")
+                self._depth = 1
+                start = match.end()
+            elif char == ord('"'):
+                continue
+            elif char in b"[{":
+                self._depth += 1
+            elif char in b"]}":
+                self._depth -= 1
+                if self._depth == 0:
+                    if char != ord("]"):
+                        raise MalformedJSON("Expected a JSON array")
+                    self._item(buffer, start, match.start(), items, True)
+                    self._done = True
+                    start = match.end()
+            elif self._depth == 1:
+                self._item(buffer, start, match.start(), items, False)
+                start = match.end()
+
+        if start:
+            del buffer[:start]
+            pos -= start
+        if len(buffer) > self._max_size:
+            raise PayloadTooLarge("Request body item exceeds the size limit")
+        self._pos = pos
+        return items
+
+    def close(self) -> list[bytes]:
+        if not self._done or self._buffer.strip():
+            raise MalformedJSON("Incomplete JSON array")
+        return []
+
+    def _item(self, buffer, start, end, items, closing) -> None:
+        item = bytes(buffer[start:end].strip())
+        if item:
+            items.append(item)
+        elif self._expect_item or not closing:
+            raise MalformedJSON("Empty item in JSON array")
+        self._expect_item = not closing
+
+
+class NDJSONSplitter:
+    """
+    Incrementally split newline delimited JSON into the raw bytes of its
+    lines, skipping blank ones. A line may not grow beyond ``max_size``
+    bytes.
+    """
+
+    __slots__ = ("_buffer", "_max_size")
+
+    def __init__(self, max_size: int = MAX_ITEM_SIZE) -> None:
+        self._buffer = bytearray()
+        self._max_size = max_size
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        buffer = self._buffer
+        # Only the new data can hold the end of the current line
+        search = len(buffer)
+        buffer += chunk
+        lines: list[bytes] = []
+        start = 0
+        while (end := buffer.find(b"\n", search)) != -1:
+            if line := bytes(buffer[start:end].strip()):
+                lines.append(line)
+            start = search = end + 1
+        if start:
+            del buffer[:start]
+        if len(buffer) > self._max_size:
+            raise PayloadTooLarge("Request body item exceeds the size limit")
+        return lines
+
+    def close(self) -> list[bytes]:
+        # The last line does not need to end with a newline
+        line = bytes(self._buffer.strip())
+        self._buffer.clear()
+        return [line] if line else []
+
+
+def make_splitter(request: Request) -> JSONArraySplitter | NDJSONSplitter:
+    content_type = request.headers.getone("content-type", "")
+    mime = content_type.split(";", 1)[0].strip().lower()
+    # A single item may be no larger than a whole request body
+    max_size = request.app.config.REQUEST_MAX_SIZE
+    if mime in NDJSON_TYPES:
+        return NDJSONSplitter(max_size)
+    return JSONArraySplitter(max_size)
+
+
+async def iter_body(request: Request) -> AsyncIterator[bytes]:
+    if request.body:
+        yield request.body
+    if request.stream is not None:
+        async for chunk in request.stream:
+            yield chunk
+
+
+async def stream_validated(
+    *,
+    model: Any,
+    decoder: Optional[Callable[[Any, bytes], Any]],
+    validator: Optional[Callable[[Any, Any], Any]],
+    request: Request,
+) -> AsyncIterator[Any]:
+    """
+    Validate the items of a JSON array or NDJSON body as the body is
+    received, and yield each of them as soon as it has been validated.
+    """
+    logger.debug(f"Streaming validation of {request.path} using {model}")
+    splitter = make_splitter(request)
+    index = 0
+    try:
+        async for chunk in iter_body(request):
+            for raw in splitter.feed(chunk):
+                yield _validate_item(model, decoder, validator, raw, index)
+                index += 1
+        for raw in splitter.close():
+            yield _validate_item(model, decoder, validator, raw, index)
+    except MalformedJSON:
+        raise BadRequest("Failed when parsing body as json") from None
+
+
+def _validate_item(model, decoder, validator, raw: bytes, index: int) -> Any:
+    try:
+        if decoder:
+            return decoder(model, raw)
+        try:
+            data = loads(raw)
+        except ValueError as e:
+            raise MalformedJSON from e
+        return validator(model, data)
+    except VALIDATION_ERROR as e:
+        raise ValidationError(
+            f"Invalid request body item {index}: {model.__name__}. Error: {e}",
+            extra={"exception": str(e), "index": index},
+        ) from None
@@ -1,6 +1,7 @@
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 from sanic_ext.exceptions import ValidationError
+from sanic_ext.utils.typing import is_msgspec, is_pydantic
 
 from .check import check_data
 from .clean import clean_data
@@ -17,6 +18,13 @@ except ImportError:
     VALIDATION_ERROR = (TypeError,)
 
 
+class MalformedJSON(Exception):
+    """
+    Raised by a JSON body decoder when the body is not valid JSON at all,
+    as opposed to valid JSON that does not match the model.
+    """
+
+
 def validate_body(
     validator: Callable[[type[Any], dict[str, Any]], Any],
     model: type[Any],
@@ -55,3 +63,59 @@ def _validate_instance(model, body, allow_coerce, strict=None):
 
 def _validate_annotations(model, body, schema, allow_multiple, allow_coerce):
     return check_data(model, body, schema, allow_multiple, allow_coerce)
+
+
+def make_json_decoder(
+    model: type[Any], strict: Optional[bool] = None
+) -> Optional[Callable[[type[Any], bytes], Any]]:
+    """
+    Build a validator that decodes raw JSON bytes straight into a msgspec
+    or pydantic model, skipping the intermediate dict. Returns None for
+    other kinds of models.
+    """
+    try:
+        if is_msgspec(model):
+            return _make_msgspec_json_decoder(model, strict)
+        if is_pydantic(model):
+            return _make_pydantic_json_decoder(model, strict)
+    except TypeError:
+        ...
+    return None
+
+
+def _make_msgspec_json_decoder(model, strict=None):
+    import msgspec
+
+    decoder = msgspec.json.Decoder(
+        model, strict=True if strict is None else strict
+    )
+
+    def decode(model, body):
+        try:
+            return decoder.decode(body)
+        except msgspec.ValidationError as e:
+            raise TypeError(str(e))
+        except msgspec.DecodeError as e:
+            raise MalformedJSON from e
+
+    return decode
+
+
+def _make_pydantic_json_decoder(model, strict=None):
+    strict = False if strict is None else strict
+    if hasattr(model, "model_validate_json"):
+        validate_json = model.model_validate_json
+    else:
+        from pydantic import TypeAdapter
+
+        validate_json = TypeAdapter(model).validate_json
+
+    def decode(model, body):
+        try:
+            return validate_json(body, strict=strict)
+        except PydanticValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                raise MalformedJSON from e
+            raise
+
+    return decode
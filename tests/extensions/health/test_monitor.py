@@ -0,0 +1,126 @@
+from types import SimpleNamespace
+
+import pytest
+
+from sanic_ext.extensions.health.metrics import FIELDS, WorkerMetrics
+from sanic_ext.extensions.health.monitor import (
+    HealthMonitor,
+    HealthState,
+    HeartbeatTable,
+    Stale,
+)
+
+
+def test_heartbeat_table_claim():
+    table = HeartbeatTable.create(2)
+
+    assert table.claim("Sanic-Server-0-0") == 0
+    assert table.claim("Sanic-Server-1-0") == 1
+    assert table.claim("Sanic-Server-0-0") == 0
+    assert table.claim("Sanic-Server-2-0") is None
+    assert table.name(1) == "Sanic-Server-1-0"
+
+
+def test_heartbeat_table_long_names():
+    table = HeartbeatTable.create(2)
+    name = "Sanic-Server-" + "é" * HeartbeatTable.NAME_SIZE
+
+    slot = table.claim(name)
+    assert table.claim(name) == slot
+    assert table.name(slot) == HeartbeatTable.truncate(name)
+
+    monitor = HealthMonitor(
+        SimpleNamespace(manager=SimpleNamespace(monitor_publisher=None))
+    )
+    monitor.watch([name])
+    table.beat(slot, (123.5, 0.0, 1024.0, 8.0, 0.0, 0.0))
+    monitor.scan(table)
+    assert list(monitor.health_state) == [name]
+    assert monitor.health_state[name].beat == 123.5
+
+
+def test_heartbeat_table_beat():
+    table = HeartbeatTable.create(2)
+    slot = table.claim("Sanic-Server-0-0")
+
+    report = (123.5, 0.25, 1024.0, 8.0, 2.0, 10.0)
+    table.beat(slot, report)
+    assert dict(table.reports()) == {0: list(report), 1: [0.0] * len(FIELDS)}
+
+
+def test_worker_metrics():
+    class FakeRequest: ...
+
+    metrics = WorkerMetrics()
+    requests = [FakeRequest(), FakeRequest()]
+    for request in requests:
+        metrics.request(request)
+    metrics.response(requests[0])
+    metrics.lag(0.5)
+    metrics.lag(0.1)
+
+    report = dict(zip(FIELDS, metrics.collect(123.5)))
+    assert report["timestamp"] == 123.5
+    assert report["loop_lag"] == 0.5
+    assert report["in_flight"] == 1
+    assert report["requests_per_second"] > 0
+    assert report["rss"] > 0
+    assert report["open_fds"] > 0
+
+    del requests, request
+    report = dict(zip(FIELDS, metrics.collect(124.5)))
+    assert report["loop_lag"] == 0
+    assert report["in_flight"] == 0
+    assert report["requests_per_second"] == 0
+
+
+@pytest.mark.parametrize(
+    "max_loop_lag,max_rss,stale",
+    (
+        (0, 0, False),
+        (1.0, 0, False),
+        (0.1, 0, True),
+        (0, 4096, False),
+        (0, 1024, True),
+    ),
+)
+def test_health_state_limits(monkeypatch, max_loop_lag, max_rss, stale):
+    monkeypatch.setattr(HealthMonitor, "MAX_LOOP_LAG", max_loop_lag)
+    monkeypatch.setattr(HealthMonitor, "MAX_RSS", max_rss)
+    state = HealthState(name="Sanic-Server-0-0")
+
+    if stale:
+        with pytest.raises(Stale):
+            state.report(123.5, 0.25, 2048.0, 8.0, 2.0, 10.0)
+    else:
+        state.report(123.5, 0.25, 2048.0, 8.0, 2.0, 10.0)
+    assert state.beat == 123.5
+    assert state.metrics["rss"] == 2048.0
+
+
+def test_health_monitor_restarts_once_per_generation(monkeypatch):
+    monkeypatch.setattr(HealthMonitor, "MAX_LOOP_LAG", 0.1)
+
+    class Publisher(list):
+        send = list.append
+
+    publisher = Publisher()
+    monitor = HealthMonitor(
+        SimpleNamespace(manager=SimpleNamespace(monitor_publisher=publisher))
+    )
+    name = "Sanic-Server-0-0"
+    monitor.watch([name])
+    table = HeartbeatTable.create(2)
+    slot = table.claim(name)
+
+    # The old process keeps reporting that it is stalled
+    for timestamp in (1.0, 2.0, 3.0):
+        table.beat(slot, (timestamp, 0.5, 1024.0, 8.0, 0.0, 0.0))
+        monitor.scan(table)
+    assert publisher == [name]
+
+    # Until a new process has claimed the slot
+    assert table.claim(name) == slot
+    table.beat(slot, (4.0, 0.5, 1024.0, 8.0, 0.0, 0.0))
+    monitor.scan(table)
+    assert publisher == [name, name]
@@ -0,0 +1,294 @@
+import re
+
+from datetime import timedelta
+
+import pytest
+
+from sanic import Sanic
+from sanic.response import text
+
+from sanic_ext import cors
+from sanic_ext.bootstrap import Extend
+from sanic_ext.extensions.http.cors import OriginMatcher
+
+
+ORIGIN = "access-control-allow-origin"
+EXPOSE = "access-control-expose-headers"
+CREDENTIALS = "access-control-allow-credentials"
+ALLOW_HEADERS = "access-control-allow-headers"
+ALLOW_METHODS = "access-control-allow-methods"
+MAX_AGE = "access-control-max-age"
+
+
+def _split(value):
+    return {item.strip() for item in value.split(",")}
+
+
+@pytest.fixture
+def cors_app(bare_app: Sanic):
+    def make(**config):
+        Extend(bare_app, config=config)
+
+        @bare_app.route("/foo", methods=["GET", "POST"])
+        async def foo(_):
+            return text("foo")
+
+        @bare_app.get("/bar")
+        @cors(
+            origin="https://bar.example.com",
+            expose_headers=["x-bar"],
+            allow_methods=["get"],
+            supports_credentials=True,
+            max_age=timedelta(minutes=1),
+        )
+        async def bar(_):
+            return text("bar")
+
+        return bare_app
+
+    return make
+
+
+def test_cors_allowed_origin(cors_app):
+    app = cors_app(
+        cors_origins="https://a.example.com,https://b.example.com",
+        cors_expose_headers="x-one,x-two",
+    )
+
+    _, response = app.test_client.get(
+        "/foo", headers={"origin": "https://b.example.com"}
+    )
+    assert response.headers[ORIGIN] == "https://b.example.com"
+    assert _split(response.headers[EXPOSE]) == {"x-one", "x-two"}
+    assert response.headers["vary"] == "origin"
+    assert CREDENTIALS not in response.headers
+    assert MAX_AGE not in response.headers
+
+
+def test_cors_disallowed_origin(cors_app):
+    app = cors_app(cors_origins="https://a.example.com")
+
+    _, response = app.test_client.get(
+        "/foo", headers={"origin": "https://evil.example.com"}
+    )
+    assert ORIGIN not in response.headers
+    assert "vary" not in response.headers
+
+
+def test_cors_regex_origin(cors_app):
+    app = cors_app(cors_origins=[re.compile(r"https://.*\.example\.com")])
+
+    _, response = app.test_client.get(
+        "/foo", headers={"origin": "https://c.example.com"}
+    )
+    assert response.headers[ORIGIN] == "https://c.example.com"
+
+    _, response = app.test_client.get(
+        "/foo", headers={"origin": "https://example.org"}
+    )
+    assert ORIGIN not in response.headers
+
+
+def test_cors_without_origin(cors_app):
+    app = cors_app(cors_origins="https://a.example.com")
+
+    _, response = app.test_client.get("/foo")
+    assert response.headers[ORIGIN] == "https://a.example.com"
+
+
+def test_cors_wildcard(cors_app):
+    app = cors_app(cors_origins="*", cors_send_wildcard=True)
+
+    _, response = app.test_client.get(
+        "/foo", headers={"origin": "https://a.example.com"}
+    )
+    assert response.headers[ORIGIN] == "*"
+    assert "vary" not in response.headers
+
+    _, response = app.test_client.get("/foo")
+    assert response.headers[ORIGIN] == "*"
+
+
+def test_cors_expose_wildcard_with_credentials(cors_app):
+    app = cors_app(cors_origins="*", cors_expose_headers="*,x-one")
+
+    _, response = app.test_client.get(
+        "/foo", headers={"origin": "https://a.example.com"}
+    )
+    assert response.headers[EXPOSE] == "*"
+
+    _, response = app.test_client.get(
+        "/foo",
+        headers={
+            "origin": "https://a.example.com",
+            "authorization": "Bearer abc",
+        },
+    )
+    assert _split(response.headers[EXPOSE]) == {"*", "x-one"}
+
+
+def test_cors_preflight(cors_app):
+    app = cors_app(
+        cors_origins="https://a.example.com",
+        cors_allow_headers="x-one,x-two",
+        cors_max_age=30,
+    )
+
+    _, response = app.test_client.options(
+        "/foo",
+        headers={
+            "origin": "https://a.example.com",
+            "access-control-request-method": "POST",
+            "access-control-request-headers": "X-One, x-three",
+        },
+    )
+    assert response.status == 204
+    assert response.headers[ORIGIN] == "https://a.example.com"
+    assert response.headers[MAX_AGE] == "30"
+    assert response.headers[ALLOW_HEADERS] == "x-one"
+    assert _split(response.headers[ALLOW_METHODS]) == {
+        "GET",
+        "HEAD",
+        "OPTIONS",
+        "POST",
+    }
+
+
+def test_cors_preflight_wildcards(cors_app):
+    app = cors_app(cors_origins="*", cors_methods="*")
+    headers = {
+        "origin": "https://a.example.com",
+        "access-control-request-method": "POST",
+        "access-control-request-headers": "x-one",
+    }
+
+    _, response = app.test_client.options("/foo", headers=headers)
+    assert response.headers[ALLOW_HEADERS] == "*"
+    assert response.headers[ALLOW_METHODS] == "*"
+
+    _, response = app.test_client.options(
+        "/foo", headers={**headers, "cookie": "session=abc"}
+    )
+    assert ALLOW_HEADERS not in response.headers
+    assert ALLOW_METHODS not in response.headers
+
+
+def test_cors_preflight_requires_request_method(cors_app):
+    app = cors_app(cors_origins="https://a.example.com")
+
+    _, response = app.test_client.options(
+        "/foo", headers={"origin": "https://a.example.com"}
+    )
+    assert response.status == 204
+    assert ORIGIN not in response.headers
+
+
+def test_cors_preflight_skips_request_middleware(cors_app):
+    app = cors_app(cors_origins="https://a.example.com")
+    seen = []
+
+    @app.on_request
+    async def reject(request):
+        seen.append(request.method)
+        return text("Unauthorized", status=401)
+
+    _, response = app.test_client.options(
+        "/foo",
+        headers={
+            "origin": "https://a.example.com",
+            "access-control-request-method": "POST",
+        },
+    )
+    assert response.status == 204
+    assert response.headers[ORIGIN] == "https://a.example.com"
+    assert _split(response.headers["allow"]) == {
+        "GET",
+        "HEAD",
+        "OPTIONS",
+        "POST",
+    }
+    assert _split(response.headers[ALLOW_METHODS]) == {
+        "GET",
+        "HEAD",
+        "OPTIONS",
+        "POST",
+    }
+    assert seen == []
+
+    _, response = app.test_client.options("/foo")
+    assert response.status == 401
+    assert seen == ["OPTIONS"]
+
+
+def test_cors_route_decorator(cors_app):
+    app = cors_app(cors_origins="https://a.example.com")
+
+    _, response = app.test_client.get(
+        "/bar", headers={"origin": "https://a.example.com"}
+    )
+    assert ORIGIN not in response.headers
+
+    _, response = app.test_client.get(
+        "/bar", headers={"origin": "https://bar.example.com"}
+    )
+    assert response.headers[ORIGIN] == "https://bar.example.com"
+    assert response.headers[EXPOSE] == "x-bar"
+    assert response.headers[CREDENTIALS] == "true"
+
+    _, response = app.test_client.options(
+        "/bar",
+        headers={
+            "origin": "https://bar.example.com",
+            "access-control-request-method": "GET",
+        },
+    )
+    assert response.headers[MAX_AGE] == "60"
+    assert response.headers[ALLOW_METHODS] == "GET"
+
+
+def test_cors_unrouted_request(cors_app):
+    app = cors_app(cors_origins="https://a.example.com")
+
+    _, response = app.test_client.get(
+        "/missing", headers={"origin": "https://a.example.com"}
+    )
+    assert response.status == 404
+    assert response.headers[ORIGIN] == "https://a.example.com"
+
+
+def test_cors_many_origins(cors_app):
+    origins = [f"https://tenant{i}.example.com" for i in range(900)]
+    app = cors_app(
+        cors_origins=[*origins, re.compile(r"https://.*\.example\.net")]
+    )
+
+    for origin in ("https://tenant899.example.com", "https://a.example.net"):
+        _, response = app.test_client.get("/foo", headers={"origin": origin})
+        assert response.headers[ORIGIN] == origin
+
+    _, response = app.test_client.get(
+        "/foo", headers={"origin": "https://tenant900.example.com"}
+    )
+    assert ORIGIN not in response.headers
+
+
+def test_origin_matcher():
+    matcher = OriginMatcher(
+        [
+            "https://a.example.com",
+            re.compile(r"https://.*\.example\.net"),
+            re.compile(r"https://.*\.example\.org$"),
+            re.compile(r"https://.*\.example\.io", re.IGNORECASE),
+            re.compile(r"(?i)https://.*\.example\.dev"),
+        ]
+    )
+
+    assert matcher.match("https://a.example.com")
+    assert not matcher.match("https://a.example.com.evil")
+    assert not matcher.match("https://b.example.com")
+    assert matcher.match("https://b.example.net")
+    assert matcher.match("https://b.example.org")
+    assert not matcher.match("https://b.example.org.evil")
+    assert matcher.match("HTTPS://B.EXAMPLE.IO")
+    assert matcher.match("HTTPS://B.EXAMPLE.DEV")
+    assert not matcher.match("HTTPS://B.EXAMPLE.NET")
@@ -1,9 +1,11 @@
 import pytest
 
 from sanic import Sanic
-from sanic.response import empty, text
+from sanic.response import empty, file, file_stream, json, text
 
+from sanic_ext import head_metadata
 from sanic_ext.bootstrap import Extend
+from sanic_ext.extensions.http.head import file_metadata
 
 
 def test_trace_and_connect_available(app: Sanic):
@@ -36,6 +38,105 @@ def test_auto_head(app: Sanic, get_docs):
     assert "get" in schema["paths"]["/foo"]
 
 
+def test_auto_head_metadata(app: Sanic):
+    calls = []
+
+    def metadata(request, name):
+        return {"content-length": str(len(name) * 1000), "x-name": name}
+
+    @app.get("/report/<name>")
+    @head_metadata(metadata)
+    async def report(_, name):
+        calls.append(name)
+        return text(name * 1000)
+
+    _, response = app.test_client.head("/report/abc")
+    assert response.status == 200
+    assert len(response.body) == 0
+    assert int(response.headers["content-length"]) == 3000
+    assert response.headers["x-name"] == "abc"
+    assert calls == []
+
+    _, response = app.test_client.get("/report/abc")
+    assert len(response.body) == 3000
+    assert calls == ["abc"]
+
+
+def test_auto_head_metadata_content_type(app: Sanic):
+    @app.get("/text")
+    @head_metadata(lambda request: {"content-length": "3"})
+    async def plain(_):
+        return text("abc")
+
+    @app.get("/json")
+    @head_metadata(
+        lambda request: {
+            "content-length": "2",
+            "Content-Type": "application/json",
+        }
+    )
+    async def data(_):
+        return json({})
+
+    for uri in ("/text", "/json"):
+        _, get = app.test_client.get(uri)
+        _, head = app.test_client.head(uri)
+        assert head.headers["content-type"] == get.headers["content-type"]
+        assert head.headers.get_list("content-type") == [
+            get.headers["content-type"]
+        ]
+
+
+async def test_file_metadata_keeps_headers(tmp_path):
+    location = tmp_path / "data.txt"
+    location.write_bytes(b"abc")
+    headers = {"x-foo": "bar"}
+
+    response = await file_metadata(location, headers=headers, filename="a")
+
+    assert headers == {"x-foo": "bar"}
+    assert response.headers["content-length"] == "3"
+    assert response.headers["content-disposition"] == (
+        'attachment; filename="a"'
+    )
+
+
+def test_auto_head_file_metadata(app: Sanic, tmp_path):
+    location = tmp_path / "data.json"
+    location.write_bytes(b'{"foo": "bar"}')
+
+    async def metadata(request):
+        return await file_metadata(location, etag=True)
+
+    @app.get("/data")
+    @head_metadata(metadata)
+    async def data(_):
+        return await file(location)
+
+    _, get = app.test_client.get("/data")
+    _, head = app.test_client.head("/data")
+    assert head.status == 200
+    assert len(head.body) == 0
+    assert head.headers["content-length"] == get.headers["content-length"]
+    assert head.headers["content-type"] == get.headers["content-type"]
+    assert head.headers["last-modified"] == get.headers["last-modified"]
+    assert head.headers["etag"].startswith('W/"e-')
+
+
+def test_auto_head_stream_with_length(app: Sanic, tmp_path):
+    location = tmp_path / "data.txt"
+    location.write_bytes(b"x" * 10)
+
+    @app.get("/data")
+    async def data(_):
+        return await file_stream(location, headers={"content-length": "10"})
+
+    _, response = app.test_client.head("/data")
+    assert response.status == 200
+    assert len(response.body) == 0
+    assert int(response.headers["content-length"]) == 10
+
+
 def test_auto_options(app: Sanic, get_docs):
     @app.post("/foo")
     async def foo_handler(_):
@@ -65,6 +166,85 @@ def test_auto_trace(bare_app: Sanic):
     assert response.body.startswith(request.head)
 
 
+def test_auto_trace_excludes_headers(bare_app: Sanic):
+    Extend(bare_app, config={"http_auto_trace": True})
+
+    @bare_app.get("/foo/<name>")
+    async def foo_handler(_, name: str):
+        return text(name)
+
+    _, response = bare_app.test_client.request(
+        "/foo/bar",
+        http_method="trace",
+        headers={
+            "Authorization": "Bearer abc",
+            "Cookie": "session=abc",
+            "x-long": "a" * 4000,
+        },
+    )
+    assert response.status == 200
+    assert response.content_type == "message/http"
+    head, body = response.body.split(b"\r\n\r\n", 1)
+    lines = head.split(b"\r\n")
+    assert lines[0] == b"TRACE /foo/bar HTTP/1.1"
+    assert b"x-long: " + b"a" * 4000 in lines
+    assert not [
+        line
+        for line in lines
+        if line.lower().startswith((b"authorization", b"cookie"))
+    ]
+    assert body == b""
+
+
+def test_auto_trace_max_size(bare_app: Sanic):
+    Extend(bare_app, config={"http_auto_trace": True, "trace_max_size": 1024})
+
+    @bare_app.get("/foo")
+    async def foo_handler(_):
+        return text("...")
+
+    _, response = bare_app.test_client.request(
+        "/foo", http_method="trace", headers={"x-long": "a" * 2048}
+    )
+    assert response.status == 413
+
+
+def test_auto_handlers_added_together(bare_app: Sanic):
+    Extend(bare_app, config={"http_auto_trace": True})
+
+    @bare_app.get("/foo")
+    async def foo_handler(_):
+        return text("...")
+
+    @bare_app.post("/bar")
+    async def bar_handler(_):
+        return text("...")
+
+    _, response = bare_app.test_client.options("/foo")
+    assert response.status == 204
+    assert set(response.headers["allow"].split(",")) == {
+        "GET",
+        "HEAD",
+        "OPTIONS",
+        "TRACE",
+    }
+
+    names = {
+        route.name.removeprefix(f"{bare_app.name}.")
+        for route in bare_app.router.routes
+        if route.uri in ("/foo", "/bar")
+    }
+    assert names == {
+        "foo_handler",
+        "foo_handler_head",
+        "foo_handler_trace",
+        "foo_handler_options",
+        "bar_handler",
+        "bar_handler_trace",
+        "bar_handler_options",
+    }
+
+
 def test_auto_head_with_vhosts(app: Sanic, get_docs):
     @app.get("/foo", host="one.com", name="one")
     async def foo_handler_one(_):
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import asyncio
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from itertools import count
 from typing import Optional
@@ -12,8 +14,10 @@ import pytest
 from sanic import Request, json, text
 from sanic.exceptions import SanicException
 from sanic.views import HTTPMethodView
+from sanic_testing.reusable import ReusableClient
 
 from sanic_ext import Extend
+from sanic_ext.exceptions import InitError
 
 
 @dataclass
@@ -414,3 +418,390 @@ def test_injection_of_lambda_properties(app):
     _, response = app.test_client.get("/foo")
 
     assert response.body == b"true"
+
+
+def test_injection_plans_compiled_on_route(app):
+    app.ext.add_dependency(Name)
+
+    @app.get("/plain")
+    def plain(request):
+        return text("plain")
+
+    @app.get("/person/<name:str>")
+    def handler(request, name: Name):
+        return text(name.name)
+
+    class View(HTTPMethodView, attach=app, uri="/view/<name:str>"):
+        async def get(self, request, name: Name):
+            return text(name.name)
+
+        async def post(self, request, name: str):
+            return text(name)
+
+    _, response = app.test_client.get("/view/george")
+    assert response.body == b"george"
+
+    routes = {route.name.split(".")[-1]: route for route in app.router.routes}
+    assert routes["plain"].ctx._injections == {}
+    assert set(routes["handler"].ctx._injections) == {"GET"}
+    assert set(routes["View"].ctx._injections) == {"GET"}
+    assert "name" in routes["View"].ctx._injections["GET"].dependencies
+
+
+class First: ...
+
+
+class Second: ...
+
+
+class Third: ...
+
+
+def test_injection_of_concurrent_dependencies(app):
+    events = []
+
+    async def make(cls, request: Request):
+        events.append(f"start:{cls.__name__}")
+        await asyncio.sleep(0.01)
+        events.append(f"end:{cls.__name__}")
+        return cls()
+
+    async def first(request: Request) -> First:
+        return await make(First, request)
+
+    async def second(request: Request) -> Second:
+        return await make(Second, request)
+
+    async def third(request: Request) -> Third:
+        return await make(Third, request)
+
+    app.ext.add_dependency(First, first, concurrent=True)
+    app.ext.add_dependency(Second, second, concurrent=True)
+    app.ext.add_dependency(Third, third)
+
+    @app.get("/")
+    async def handler(request, third: Third, first: First, second: Second):
+        return json(
+            [
+                isinstance(third, Third),
+                isinstance(first, First),
+                isinstance(second, Second),
+            ]
+        )
+
+    _, response = app.test_client.get("/")
+
+    assert all(response.json)
+    assert events[:2] == ["start:Third", "end:Third"]
+    assert events[2:4] == ["start:First", "start:Second"]
+
+
+def test_failed_concurrent_dependency_cancels_siblings(app):
+    events = []
+
+    async def first(request: Request) -> First:
+        raise ValueError("first")
+
+    async def second(request: Request) -> Second:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            events.append("cancelled:Second")
+            raise
+        return Second()
+
+    app.ext.add_dependency(First, first, concurrent=True)
+    app.ext.add_dependency(Second, second, concurrent=True)
+
+    @app.get("/")
+    async def handler(request, first: First, second: Second):
+        return text("ok")
+
+    _, response = app.test_client.get("/")
+
+    assert response.status == 500
+    assert events == ["cancelled:Second"]
+
+
+class Settings:
+    built = 0
+
+    def __init__(self) -> None:
+        Settings.built += 1
+
+
+class Service:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+class Repository:
+    def __init__(self, settings: Settings) -> None:
+        self.settings = settings
+
+
+class RequestBound:
+    def __init__(self, request: Request) -> None:
+        self.request = request
+
+
+@pytest.fixture
+def settings_built():
+    Settings.built = 0
+    yield
+    Settings.built = 0
+
+
+def test_injection_added_before_server_start(app, settings_built):
+    @app.before_server_start
+    async def register(app):
+        app.ext.add_dependency(Settings)
+
+    @app.get("/")
+    async def handler(request, settings: Settings):
+        return json(isinstance(settings, Settings))
+
+    _, response = app.test_client.get("/")
+    assert response.status == 200
+    assert response.json is True
+
+
+def test_injection_request_scope(app, settings_built):
+    app.ext.add_dependency(Settings, scope="request")
+    app.ext.add_dependency(Service)
+    app.ext.add_dependency(Repository)
+
+    @app.get("/")
+    async def handler(
+        request, settings: Settings, service: Service, repo: Repository
+    ):
+        return json(settings is service.settings and settings is repo.settings)
+
+    with ReusableClient(app) as client:
+        for _ in range(2):
+            _, response = client.get("/")
+            assert response.json is True
+
+    assert Settings.built == 2
+
+
+def test_injection_worker_scope(app, settings_built):
+    app.ext.add_dependency(Settings, scope="worker")
+    app.ext.add_dependency(Service)
+
+    @app.get("/")
+    async def handler(request, service: Service):
+        return json(Settings.built)
+
+    with ReusableClient(app) as client:
+        _, first = client.get("/")
+        _, second = client.get("/")
+
+    assert first.json == second.json == 1
+    assert Settings.built == 1
+
+
+def test_injection_app_scope(app, settings_built):
+    app.ext.add_dependency(Settings, scope="app")
+
+    @app.before_server_start(priority=-2_000)
+    async def check(_):
+        assert Settings.built == 1
+
+    @app.get("/")
+    async def handler(request, settings: Settings):
+        return json(Settings.built)
+
+    _, response = app.test_client.get("/")
+    assert response.json == 1
+
+
+@pytest.mark.parametrize("scope", ("worker", "app"))
+def test_injection_long_lived_scope_requires_request(app, scope):
+    app.ext.add_dependency(RequestBound, scope=scope)
+
+    @app.get("/")
+    async def handler(request, bound: RequestBound):
+        return text("")
+
+    with pytest.raises(InitError, match=f"Cannot use the '{scope}' scope"):
+        app.test_client.get("/")
+
+
+@pytest.mark.parametrize("scope", ("worker", "app"))
+def test_injection_long_lived_scope_requires_request_scope(app, scope):
+    app.ext.add_dependency(Settings, scope="request")
+    app.ext.add_dependency(Service, scope=scope)
+
+    @app.get("/")
+    async def handler(request, service: Service):
+        return text("")
+
+    with pytest.raises(InitError, match=f"Cannot use the '{scope}' scope"):
+        app.test_client.get("/")
+
+
+def test_injection_invalid_scope(app):
+    with pytest.raises(ValueError):
+        app.ext.add_dependency(Settings, scope="forever")
+
+
+class Connection:
+    def __init__(self, events: list[str]) -> None:
+        self.events = events
+
+
+def test_injection_async_generator_teardown(app):
+    events = []
+
+    async def connect(request: Request) -> AsyncIterator[Connection]:
+        events.append("open")
+        try:
+            yield Connection(events)
+        except ZeroDivisionError:
+            events.append("rollback")
+            raise
+        finally:
+            events.append("close")
+
+    app.ext.add_dependency(Connection, connect)
+
+    @app.get("/")
+    async def handler(request, conn: Connection):
+        conn.events.append("handler")
+        return text("ok")
+
+    @app.get("/error")
+    async def error(request, conn: Connection):
+        conn.events.append("handler")
+        1 / 0
+
+    _, response = app.test_client.get("/")
+    assert response.status == 200
+    assert events == ["open", "handler", "close"]
+
+    events.clear()
+    _, response = app.test_client.get("/error")
+    assert response.status == 500
+    assert events == ["open", "handler", "rollback", "close"]
+
+
+def test_injection_async_context_manager_teardown(app):
+    events = []
+
+    @asynccontextmanager
+    async def connect() -> AsyncIterator[Connection]:
+        events.append("open")
+        yield Connection(events)
+        events.append("close")
+
+    app.ext.add_dependency(Connection, connect, scope="request")
+
+    @app.get("/")
+    async def handler(request, conn: Connection, again: Connection):
+        conn.events.append("handler")
+        return json(conn is again)
+
+    _, response = app.test_client.get("/")
+    assert response.json is True
+    assert events == ["open", "handler", "close"]
+
+
+class Conn:
+    def __init__(self) -> None:
+        self.closed = False
+
+
+async def open_conn() -> AsyncIterator[Conn]:
+    conn = Conn()
+    try:
+        yield conn
+    finally:
+        conn.closed = True
+
+
+async def make_first() -> First:
+    await asyncio.sleep(0)
+    return First()
+
+
+@pytest.mark.parametrize(
+    "options",
+    ({"concurrent": True}, {"scope": "request"}),
+    ids=("concurrent", "request"),
+)
+def test_injection_managed_dependency_outlives_child_tasks(app, options):
+    conns = []
+    app.ext.add_dependency(Conn, open_conn, **options)
+    app.ext.add_dependency(First, make_first, concurrent=True)
+
+    @app.get("/")
+    async def handler(request, conn: Conn, first: First):
+        conns.append(conn)
+        await asyncio.sleep(0.01)
+        return json(conn.closed)
+
+    _, response = app.test_client.get("/")
+    assert response.json is False
+    assert conns[0].closed
+
+
+def test_injection_managed_dependency_added_before_server_start(app):
+    conns = []
+
+    @app.before_server_start
+    async def register(app):
+        app.ext.add_dependency(Conn, open_conn)
+
+    @app.get("/")
+    async def handler(request, conn: Conn):
+        conns.append(conn)
+        return json(conn.closed)
+
+    with ReusableClient(app) as client:
+        _, response = client.get("/")
+        assert response.json is False
+        assert conns[0].closed
+
+
+class Pool:
+    def __init__(self, conn: Conn) -> None:
+        self.conn = conn
+
+
+def test_injection_worker_scope_keeps_managed_dependency(app):
+    app.ext.add_dependency(Conn, open_conn)
+    app.ext.add_dependency(Pool, scope="worker")
+
+    @app.get("/")
+    async def handler(request, pool: Pool):
+        return json(pool.conn.closed)
+
+    with ReusableClient(app) as client:
+        _, first = client.get("/")
+        _, second = client.get("/")
+
+    assert first.json is second.json is False
+
+
+def test_injection_worker_scope_teardown_on_stop(app):
+    events = []
+
+    async def connect() -> AsyncIterator[Connection]:
+        events.append("open")
+        yield Connection(events)
+        events.append("close")
+
+    app.ext.add_dependency(Connection, connect, scope="worker")
+
+    @app.get("/")
+    async def handler(request, conn: Connection):
+        conn.events.append("handler")
+        return text("ok")
+
+    with ReusableClient(app) as client:
+        client.get("/")
+        client.get("/")
+        assert events == ["open", "handler", "handler"]
+
+    assert events == ["open", "handler", "handler", "close"]
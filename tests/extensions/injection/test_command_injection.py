@@ -3,13 +3,19 @@ from __future__ import annotations
 import os
 import sys
 
+from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import get_type_hints
 from unittest.mock import patch
 
 import pytest
 
 from sanic.__main__ import main
 
+from sanic_ext.extensions.injection.command_wrapper import (
+    create_command_wrapper,
+)
+
 
 @pytest.fixture(scope="module", autouse=True)
 def tty():
@@ -121,3 +127,58 @@ def test_command_circular_dependency_error(caplog):
     with patch("sys.argv", ["sanic", *args]):
         with pytest.raises(RuntimeError, match="Circular dependency detected"):
             capture(args, caplog)
+
+
+async def test_command_wrapper_caches_hints(app):
+    class Alpha: ...
+
+    class Beta:
+        def __init__(self, alpha: Alpha = None):
+            self.alpha = alpha
+
+    async def command(beta: Beta, alpha: Alpha = None):
+        return beta, alpha
+
+    command.__annotations__ = {"beta": Beta, "alpha": Alpha}
+    Beta.__init__.__annotations__ = {"alpha": Alpha}
+
+    app.ext.add_dependency(Beta)
+    wrapped = create_command_wrapper(command, app)
+
+    with patch(
+        "sanic_ext.extensions.injection.command_wrapper.get_type_hints",
+        wraps=get_type_hints,
+    ) as mock:
+        for _ in range(3):
+            beta, alpha = await wrapped()
+            assert isinstance(beta, Beta)
+            assert beta.alpha is alpha is None
+        assert mock.call_count == 2
+
+        app.ext.add_dependency(Alpha)
+        beta, alpha = await wrapped()
+        assert isinstance(beta.alpha, Alpha)
+        assert isinstance(alpha, Alpha)
+
+
+async def test_command_wrapper_releases_managed_dependency(app):
+    events = []
+
+    class Conn: ...
+
+    async def connect() -> AsyncIterator[Conn]:
+        events.append("open")
+        yield Conn()
+        events.append("close")
+
+    async def command(conn: Conn):
+        events.append("command")
+        return conn
+
+    command.__annotations__ = {"conn": Conn}
+
+    app.ext.add_dependency(Conn, connect)
+    wrapped = create_command_wrapper(command, app)
+
+    assert isinstance(await wrapped(), Conn)
+    assert events == ["open", "command", "close"]
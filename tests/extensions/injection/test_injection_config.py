@@ -39,4 +39,4 @@ def test_add_injection_uses_signal_config():
     app.ext.config.INJECTION_PRIORITY = 99999
     add_injection(app, Mock(), Mock())
 
-    app.signal.assert_called_once_with("random_string", priority=99999)
+    app.signal.assert_any_call("random_string", priority=99999)
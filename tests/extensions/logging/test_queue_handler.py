@@ -0,0 +1,207 @@
+import logging
+
+from queue import Queue
+
+import pytest
+
+from sanic import Sanic
+from sanic.exceptions import SanicException
+
+from sanic_ext import Extend
+from sanic_ext.extensions.logging.logger import (
+    Logger,
+    OverflowPolicy,
+    SanicQueueHandler,
+    get_destination_levels,
+    to_record,
+)
+
+
+def make_record(msg, name="sanic.root", level=logging.INFO):
+    return logging.makeLogRecord(
+        {
+            "name": name,
+            "msg": msg,
+            "levelno": level,
+            "levelname": logging.getLevelName(level),
+        }
+    )
+
+
+def test_records_are_sent_in_batches():
+    queue = Queue()
+    handler = SanicQueueHandler(queue, batch_size=3)
+
+    for i in range(7):
+        handler.handle(make_record(f"line {i}"))
+
+    assert [[r.msg for r in batch] for batch in queue.queue] == [
+        ["line 0", "line 1", "line 2"],
+        ["line 3", "line 4", "line 5"],
+    ]
+
+    handler.flush()
+    assert [r.msg for r in queue.queue[-1]] == ["line 6"]
+
+    handler.flush()
+    assert len(queue.queue) == 3
+
+
+def test_full_queue_emits_in_process(capsys):
+    queue = Queue(maxsize=1)
+    handler = SanicQueueHandler(queue, batch_size=1)
+
+    handler.handle(make_record("first"))
+    handler.handle(make_record("second"))
+
+    assert [r.msg for r in queue.get_nowait()] == ["first"]
+    err = capsys.readouterr().err
+    assert "Background logger is full" in err
+    assert "second" in err
+
+
+def test_logger_handles_child_loggers(caplog, monkeypatch):
+    monkeypatch.setattr(Logger, "LOGGERS", ["sanic.root"])
+    logger = Logger()
+
+    with caplog.at_level(logging.INFO):
+        logger.handle(
+            [make_record("parent"), make_record("child", "sanic.root.child")]
+        )
+    assert [(r.name, r.msg) for r in caplog.records] == [
+        ("sanic.root", "parent"),
+        ("sanic.root.child", "child"),
+    ]
+
+
+def test_records_are_formatted_in_the_worker():
+    queue = Queue()
+    formatters = {"sanic.root": logging.Formatter("%(levelname)s %(message)s")}
+    handler = SanicQueueHandler(queue, batch_size=2, formatters=formatters)
+
+    handler.handle(make_record("parent"))
+    handler.handle(make_record("child", "sanic.root.child", logging.ERROR))
+
+    assert queue.get_nowait() == [
+        ("sanic.root", logging.INFO, "INFO parent"),
+        ("sanic.root.child", logging.ERROR, "ERROR child"),
+    ]
+    assert formatters["sanic.root.child"] is formatters["sanic.root"]
+
+    record = to_record(("sanic.root.child", logging.ERROR, "ERROR child"))
+    assert record.name == "sanic.root.child"
+    assert record.levelname == "ERROR"
+    assert record.getMessage() == "ERROR child"
+
+
+def test_records_below_destination_level_are_dropped():
+    queue = Queue()
+    levels = {"sanic.root": logging.WARNING, "sanic.access": logging.NOTSET}
+    handler = SanicQueueHandler(queue, batch_size=1, levels=levels)
+    assert handler.level == logging.NOTSET
+
+    handler.handle(make_record("info"))
+    handler.handle(make_record("child info", "sanic.root.child"))
+    handler.handle(make_record("warning", level=logging.WARNING))
+    handler.handle(make_record("access", "sanic.access"))
+
+    assert [batch[0].msg for batch in queue.queue] == ["warning", "access"]
+
+
+def test_destination_levels(app: Sanic, monkeypatch):
+    parent = logging.getLogger("destination")
+    child = logging.getLogger("destination.child")
+    lonely = logging.getLogger("destination.lonely")
+    parent_handler = logging.NullHandler(logging.ERROR)
+    child_handler = logging.NullHandler(logging.INFO)
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])
+    monkeypatch.setattr(parent, "handlers", [parent_handler])
+    monkeypatch.setattr(child, "handlers", [child_handler])
+    monkeypatch.setattr(lonely, "propagate", False)
+    monkeypatch.setattr(logging, "lastResort", None)
+    app.config.LOGGERS = [
+        "destination",
+        "destination.child",
+        "destination.lonely",
+    ]
+
+    assert get_destination_levels(app) == {
+        "destination": logging.ERROR,
+        "destination.child": logging.INFO,
+        "destination.lonely": logging.CRITICAL + 1,
+    }
+
+
+def test_overflow_drop_keeps_warnings():
+    queue = Queue(maxsize=1)
+    handler = SanicQueueHandler(
+        queue, batch_size=1, overflow=OverflowPolicy("drop")
+    )
+
+    handler.handle(make_record("first"))
+    handler.handle(make_record("dropped"))
+    handler.handle(make_record("kept", level=logging.WARNING))
+    handler.handle(make_record("dropped", "sanic.root.child"))
+    assert handler.overflowing
+    assert [r.msg for r in queue.get_nowait()] == ["first"]
+
+    handler.flush()
+    assert not handler.overflowing
+    assert [r.msg for r in queue.get_nowait()] == ["kept"]
+
+    handler.report()
+    handler.flush()
+    (report,) = queue.get_nowait()
+    assert report.levelno == logging.WARNING
+    assert report.msg == (
+        "Background logger was full. Dropped 2 and sampled out 0 records "
+        "(sanic.root: 1, sanic.root.child: 1)"
+    )
+
+    handler.report()
+    assert handler.buffer == []
+
+
+def test_overflow_sample_per_logger():
+    queue = Queue(maxsize=1)
+    policy = OverflowPolicy(
+        "sample", sample_rate=0, sample_rates={"sanic.access": 1}
+    )
+    handler = SanicQueueHandler(queue, batch_size=1, overflow=policy)
+
+    handler.handle(make_record("first"))
+    for name in ("sanic.root", "sanic.access", "sanic.root", "sanic.access"):
+        handler.handle(make_record(name, name))
+    queue.get_nowait()
+    handler.flush()
+
+    assert [r.msg for r in queue.get_nowait()] == [
+        "sanic.access",
+        "sanic.access",
+    ]
+    assert policy.sampled == {"sanic.root": 2}
+    assert not policy.dropped
+
+
+def test_overflow_emits_excess_warnings_in_process(capsys):
+    queue = Queue(maxsize=1)
+    policy = OverflowPolicy("drop", max_held=1)
+    handler = SanicQueueHandler(queue, batch_size=1, overflow=policy)
+
+    handler.handle(make_record("first"))
+    handler.handle(make_record("oldest", level=logging.ERROR))
+    handler.handle(make_record("newest", level=logging.ERROR))
+    handler.flush()
+
+    assert [handler.buffer[0].msg] == ["newest"]
+    assert "oldest" in capsys.readouterr().err
+
+
+def test_invalid_overflow_policy(bare_app: Sanic):
+    with pytest.raises(SanicException, match="LOGGING_OVERFLOW"):
+        Extend(bare_app, config={"logging": True, "logging_overflow": "x"})
+
+
+def test_invalid_preformat(bare_app: Sanic):
+    with pytest.raises(SanicException, match="LOGGING_PREFORMAT"):
+        Extend(bare_app, config={"logging": True, "logging_preformat": "xml"})
@@ -1,5 +1,8 @@
 from pathlib import Path
 
+from sanic.response import text
+from sanic_testing.reusable import ReusableClient
+
 from sanic_ext.extensions.openapi.builders import SpecificationBuilder
 
 
@@ -35,3 +38,85 @@ def test_custom_specification(app):
 
     _, response = app.test_client.get("/docs/openapi.json")
     assert response.text == petstore_data
+
+
+def test_specification_etag_not_modified(app):
+    _, response = app.test_client.get("/docs/openapi.json")
+    etag = response.headers["etag"]
+    assert etag
+
+    _, response = app.test_client.get(
+        "/docs/openapi.json", headers={"if-none-match": etag}
+    )
+    assert response.status == 304
+    assert response.headers["etag"] == etag
+    assert not response.body
+
+
+def test_specification_compressed(app):
+    _, identity = app.test_client.get(
+        "/docs/openapi.json", headers={"accept-encoding": "identity"}
+    )
+    assert "content-encoding" not in identity.headers
+
+    _, response = app.test_client.get(
+        "/docs/openapi.json", headers={"accept-encoding": "gzip"}
+    )
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "accept-encoding"
+    assert response.headers["etag"] != identity.headers["etag"]
+    assert response.json == identity.json
+
+
+def test_specification_invalidate(app):
+    @app.get("/tag")
+    async def tag(request):
+        request.app.ext.openapi.tag("runtime")
+        if "invalidate" in request.args:
+            request.app.ext.openapi.invalidate(request.app)
+        return text("tagged")
+
+    with ReusableClient(app) as client:
+        _, response = client.get("/docs/openapi.json")
+        etag = response.headers["etag"]
+
+        client.get("/tag")
+        _, response = client.get("/docs/openapi.json")
+        assert response.headers["etag"] == etag
+        assert "runtime" not in {t["name"] for t in response.json["tags"]}
+
+        client.get("/tag?invalidate=1")
+        _, response = client.get("/docs/openapi.json")
+        assert response.headers["etag"] != etag
+        assert "runtime" in {t["name"] for t in response.json["tags"]}
+
+
+def test_specification_built_at_startup(app):
+    @app.get("/built")
+    async def built(request):
+        specification = SpecificationBuilder()
+        return text(str(request.app.name in specification._documents))
+
+    _, response = app.test_client.get("/built")
+    assert response.text == "True"
+
+
+def test_specification_invalidate_keeps_servers(app):
+    app.config.API_HOST = "example.com"
+
+    @app.get("/invalidate")
+    async def invalidate(request):
+        request.app.ext.openapi.invalidate(request.app)
+        return text("ok")
+
+    with ReusableClient(app) as client:
+        _, response = client.get("/docs/openapi.json")
+        servers = response.json["servers"]
+        assert [server["url"] for server in servers] == ["http://example.com/"]
+
+        for _ in range(2):
+            client.get("/invalidate")
+            _, response = client.get("/docs/openapi.json")
+            assert response.json["servers"] == servers
+
+    assert SpecificationBuilder()._urls == ["http://example.com/"]
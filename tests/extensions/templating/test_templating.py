@@ -3,6 +3,7 @@ from pathlib import Path
 from sanic import Sanic
 
 from sanic_ext import render
+from sanic_ext.extensions.templating.extension import precompile_templates
 
 
 def test_default_templates():
@@ -165,3 +166,32 @@ def test_default_context():
 
     _, response = app.test_client.get("/4?test=passing")
     assert response.text == "passing"
+
+
+def test_bytecode_cache(tmp_path: Path):
+    cache = tmp_path / "cache"
+    app = Sanic("templating")
+    app.extend(
+        config={
+            "templating_path_to_templates": Path(__file__).parent
+            / "templates",
+            "templating_bytecode_cache": cache,
+        }
+    )
+    environment = app.ext.environment
+    assert environment.bytecode_cache.directory == str(cache)
+
+    precompile_templates(environment)
+    entries = list(cache.glob("__jinja2_*.cache"))
+    assert len(entries) >= 2
+
+    environment.cache.clear()
+
+    @app.get("/")
+    @app.ext.template("foo.html")
+    async def handler(_):
+        return {"seq": ["one"]}
+
+    _, response = app.test_client.get("/")
+    assert "<li>one</li>" in response.text
+    assert sorted(cache.glob("__jinja2_*.cache")) == sorted(entries)
@@ -0,0 +1,124 @@
+from dataclasses import dataclass
+
+import pytest
+
+from sanic import json
+
+from sanic_ext import validate
+from sanic_ext.exceptions import InitError
+from sanic_ext.extras.validation.batch import BatchResult
+
+
+def _dataclass_item():
+    @dataclass
+    class Item:
+        name: str
+        count: int
+
+    return Item
+
+
+def _msgspec_item():
+    from msgspec import Struct
+
+    class Item(Struct):
+        name: str
+        count: int
+
+    return Item
+
+
+def _pydantic_item():
+    from pydantic import BaseModel
+
+    class Item(BaseModel):
+        name: str
+        count: int
+
+    return Item
+
+
+ITEM_BUILDERS = (_dataclass_item, _msgspec_item, _pydantic_item)
+PAYLOAD = [
+    {"name": "a", "count": 1},
+    {"name": "b"},
+    {"name": "c", "count": 3},
+    {"name": "d", "count": "four"},
+]
+
+
+@pytest.mark.parametrize("item_builder", ITEM_BUILDERS)
+def test_validate_batch(app, item_builder):
+    Item = item_builder()
+
+    @app.post("/items")
+    @validate(json=list[Item], batch=True)
+    async def handler(_, body: list[Item]):
+        return json([item.name for item in body])
+
+    _, response = app.test_client.post("/items", json=PAYLOAD[::2])
+    assert response.status == 200
+    assert response.json == ["a", "c"]
+
+
+@pytest.mark.parametrize("item_builder", ITEM_BUILDERS)
+def test_validate_batch_reports_every_rejected_index(app, item_builder):
+    Item = item_builder()
+
+    @app.post("/items")
+    @validate(json=list[Item], batch=True)
+    async def handler(_, body: list[Item]): ...
+
+    _, response = app.test_client.post("/items", json=PAYLOAD)
+    assert response.status == 400
+    assert "2 of 4" in response.json["message"]
+    rejected = response.json["context"]["rejected"]
+    assert [error["index"] for error in rejected] == [1, 3]
+    assert all(error["error"] for error in rejected)
+
+
+@pytest.mark.parametrize("item_builder", ITEM_BUILDERS)
+def test_validate_batch_partial(app, item_builder):
+    Item = item_builder()
+
+    @app.post("/items")
+    @validate(json=list[Item], batch=True, partial=True)
+    async def handler(_, body: BatchResult[Item]):
+        assert not body.ok
+        return json(
+            {
+                "names": [item.name for item in body],
+                **body.report(),
+            },
+            status=207,
+        )
+
+    _, response = app.test_client.post("/items", json=PAYLOAD)
+    assert response.status == 207
+    assert response.json["names"] == ["a", "c"]
+    assert response.json["accepted"] == [0, 2]
+    assert [error["index"] for error in response.json["rejected"]] == [1, 3]
+
+
+def test_validate_batch_requires_list(app):
+    Item = _dataclass_item()
+
+    @app.post("/items")
+    @validate(json=list[Item], batch=True)
+    async def handler(_, body: list[Item]): ...
+
+    _, response = app.test_client.post("/items", json=PAYLOAD[0])
+    assert response.status == 400
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"batch": True, "stream": True},
+        {"partial": True},
+        {"form": _dataclass_item(), "batch": True},
+    ),
+)
+def test_validate_batch_init_errors(kwargs):
+    with pytest.raises(InitError):
+        validate(**kwargs)
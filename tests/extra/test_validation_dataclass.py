@@ -1,7 +1,12 @@
+import gc
+import re
 import sys
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from inspect import Parameter, Signature
+from typing import Any, Literal, Optional, Union
+from unittest.mock import patch
+from weakref import ref
 
 import pytest
 
@@ -9,7 +14,12 @@ from sanic import json
 from sanic.views import HTTPMethodView
 
 from sanic_ext import validate
-from sanic_ext.extras.validation.check import check_data
+from sanic_ext.extras.validation.check import (
+    check_data,
+    compile_hint,
+    model_validator,
+)
+from sanic_ext.extras.validation.clean import _list_fields_cache, clean_data
 from sanic_ext.extras.validation.schema import make_schema, parse_hint
 
 from . import __models__ as models
@@ -408,3 +418,98 @@ def test_validate_query(app):
     assert response.status == 200
     assert response.json["is_search"]
     assert response.json["q"] == "Snoopy"
+
+
+def test_compiled_validator_cached_on_schema():
+    schema = make_schema({}, models.ModelListModel)
+
+    check_data(models.ModelListModel, {"foo": [{"foo": "bar"}]}, schema)
+    validator = model_validator(models.ModelListModel, schema)
+    check_data(models.ModelListModel, {"foo": [{"foo": "baz"}]}, schema)
+
+    assert model_validator(models.ModelListModel, schema) is validator
+    assert set(schema["ModelListModel"]["validators"]) == {(False, False)}
+    assert set(schema["ModelStr"]["validators"]) == {(False, False)}
+
+
+@pytest.mark.parametrize(
+    "hint,value,error",
+    (
+        (Union[int, str], 1, None),
+        (Union[int, str], "1", None),
+        (
+            Union[int, str],
+            1.1,
+            "Value '1.1' must be one of <class 'int'>, <class 'str'>",
+        ),
+        (
+            Union[int, Any],
+            1.1,
+            "Value '1.1' must be one of <class 'int'>, typing.Any",
+        ),
+        (Literal["a", "b"], "a", None),
+        (Literal["a", "b"], "c", "Value 'c' must be one of a, b"),
+        (Literal["a", "b"], ["a"], "Value '['a']' must be one of a, b"),
+        (list[Union[Literal[1], str]], [1, "x"], None),
+        (
+            list[Union[Literal[1], str]],
+            [2],
+            f"Value '[2]' must be a {list[Union[Literal[1], str]]}",
+        ),
+    ),
+)
+def test_compiled_hint(hint, value, error):
+    parsed = parse_hint(hint)
+    compiled = compile_hint(parsed, {})
+
+    if error is None:
+        assert compiled(value) == parsed.validate(value, {}) == value
+    else:
+        with pytest.raises(ValueError, match=re.escape(error)):
+            compiled(value)
+        with pytest.raises(ValueError, match=re.escape(error)):
+            parsed.validate(value, {})
+
+
+def test_hydration_without_signature_bind():
+    @dataclass
+    class Pet:
+        name: str
+        tricks: list[str] = field(default_factory=list)
+        age: Optional[int] = None
+
+    schema = make_schema({}, Pet)
+    assert schema["Pet"]["params"] == (
+        ("name", Parameter.empty),
+        ("tricks", schema["Pet"]["sig"].parameters["tricks"].default),
+        ("age", None),
+    )
+
+    with patch.object(Signature, "bind") as bind:
+        pet = check_data(Pet, {"name": "Snoopy"}, schema)
+        bind.assert_not_called()
+
+    assert pet == Pet("Snoopy", [], None)
+
+    with pytest.raises(TypeError, match="missing a required argument"):
+        check_data(Pet, {"age": 1}, schema)
+    with pytest.raises(TypeError, match="unexpected keyword argument 'x'"):
+        check_data(Pet, {"name": "Snoopy", "x": 1}, schema)
+
+
+def test_clean_data_does_not_keep_models_alive():
+    @dataclass
+    class Query:
+        q: str
+        tags: list[str]
+
+    assert clean_data(Query, {"q": ["test"], "tags": ["one"]}) == {
+        "q": "test",
+        "tags": ["one"],
+    }
+    assert Query in _list_fields_cache
+
+    model = ref(Query)
+    del Query
+    gc.collect()
+    assert model() is None
@@ -540,3 +540,34 @@ def test_validate_combined_query_lax_body_strict(app):
         "/data", params={"page": "5"}, json={"count": "10"}
     )
     assert response.status == 400
+
+
+def test_validate_json_decodes_raw_body(app):
+    class Pet(Struct):
+        name: str
+        alter_ego: list[str]
+
+    @app.post("/")
+    @validate(json=Pet)
+    async def handler(request, body: Pet):
+        return json(
+            {
+                "parsed": request.parsed_json is not None,
+                "pet": {"name": body.name, "alter_ego": body.alter_ego},
+            }
+        )
+
+    _, response = app.test_client.post("/", json=SNOOPY_DATA)
+    assert response.status == 200
+    assert response.json == {"parsed": False, "pet": SNOOPY_DATA}
+
+    _, response = app.test_client.post("/", json={"name": "Snoopy"})
+    assert response.status == 400
+    assert "alter_ego" in response.json["message"]
+
+    _, response = app.test_client.post("/", data="{not json")
+    assert response.status == 400
+    assert "Failed when parsing body as json" in response.json["message"]
+
+    _, response = app.test_client.post("/")
+    assert response.status == 400
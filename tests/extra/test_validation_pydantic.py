@@ -309,6 +309,27 @@ def test_validate_query_coerces_string_to_int(app):
     assert response.json["limit_type"] == "int"
 
 
+def test_validate_query_keeps_aliased_list_fields(app):
+    class SearchQuery(pydantic.BaseModel):
+        q: str
+        tags: List[str] = pydantic.Field(alias="tag")
+
+    @app.get("/search")
+    @validate(query=SearchQuery)
+    async def handler(_, query: SearchQuery):
+        return json({"q": query.q, "tags": query.tags})
+
+    _, response = app.test_client.get(
+        "/search", params={"q": "test", "tag": "one"}
+    )
+    assert response.status == 200
+    assert response.json == {"q": "test", "tags": ["one"]}
+
+    _, response = app.test_client.get("/search?q=test&tag=one&tag=two")
+    assert response.status == 200
+    assert response.json == {"q": "test", "tags": ["one", "two"]}
+
+
 def test_validate_query_with_invalid_value(app):
     """Test that lax mode still rejects completely invalid values."""
 
@@ -428,3 +449,31 @@ def test_validate_combined_query_lax_body_strict(app):
         "/data", params={"page": "5"}, json={"count": "10"}
     )
     assert response.status == 400
+
+
+def test_validate_json_decodes_raw_body(app):
+    class Pet(pydantic.BaseModel):
+        name: str
+        alter_ego: list[str]
+
+    @app.post("/")
+    @validate(json=Pet)
+    async def handler(request, body: Pet):
+        return json(
+            {
+                "parsed": request.parsed_json is not None,
+                "pet": body.model_dump(),
+            }
+        )
+
+    _, response = app.test_client.post("/", json=SNOOPY_DATA)
+    assert response.status == 200
+    assert response.json == {"parsed": False, "pet": SNOOPY_DATA}
+
+    _, response = app.test_client.post("/", json={"name": "Snoopy"})
+    assert response.status == 400
+    assert "alter_ego" in response.json["message"]
+
+    _, response = app.test_client.post("/", data="{not json")
+    assert response.status == 400
+    assert "Failed when parsing body as json" in response.json["message"]
@@ -0,0 +1,173 @@
+from dataclasses import dataclass
+
+import pytest
+
+from sanic import json
+from sanic.exceptions import PayloadTooLarge
+
+from sanic_ext import validate
+from sanic_ext.exceptions import InitError
+from sanic_ext.extras.validation.stream import (
+    JSONArraySplitter,
+    NDJSONSplitter,
+)
+from sanic_ext.extras.validation.validators import MalformedJSON
+
+
+def _dataclass_item():
+    @dataclass
+    class Item:
+        name: str
+        count: int
+
+    return Item
+
+
+def _msgspec_item():
+    from msgspec import Struct
+
+    class Item(Struct):
+        name: str
+        count: int
+
+    return Item
+
+
+def _pydantic_item():
+    from pydantic import BaseModel
+
+    class Item(BaseModel):
+        name: str
+        count: int
+
+    return Item
+
+
+ITEM_BUILDERS = (_dataclass_item, _msgspec_item, _pydantic_item)
+
+
+@pytest.mark.parametrize("item_builder", ITEM_BUILDERS)
+def test_validate_stream_json_array(app, item_builder):
+    Item = item_builder()
+
+    @app.post("/items", stream=True)
+    @validate(json=list[Item], stream=True)
+    async def handler(_, body):
+        return json([[item.name, item.count] async for item in body])
+
+    payload = [{"name": f"item{i}", "count": i} for i in range(50)]
+    _, response = app.test_client.post("/items", json=payload)
+    assert response.status == 200
+    assert response.json == [[f"item{i}", i] for i in range(50)]
+
+
+@pytest.mark.parametrize("item_builder", ITEM_BUILDERS)
+def test_validate_stream_ndjson(app, item_builder):
+    Item = item_builder()
+
+    @app.post("/items", stream=True)
+    @validate(json=Item, stream=True)
+    async def handler(_, body):
+        return json([item.name async for item in body])
+
+    _, response = app.test_client.post(
+        "/items",
+        content=b'{"name": "a", "count": 1}\n\n{"name": "b", "count": 2}',
+        headers={"content-type": "application/x-ndjson"},
+    )
+    assert response.status == 200
+    assert response.json == ["a", "b"]
+
+
+@pytest.mark.parametrize("item_builder", ITEM_BUILDERS)
+def test_validate_stream_reports_failing_index(app, item_builder):
+    Item = item_builder()
+
+    @app.post("/items", stream=True)
+    @validate(json=list[Item], stream=True)
+    async def handler(_, body):
+        return json([item.name async for item in body])
+
+    _, response = app.test_client.post(
+        "/items",
+        json=[
+            {"name": "a", "count": 1},
+            {"name": "b", "count": "two"},
+        ],
+    )
+    assert response.status == 400
+    assert "item 1" in response.json["message"]
+
+
+def test_validate_stream_malformed_body(app):
+    Item = _dataclass_item()
+
+    @app.post("/items", stream=True)
+    @validate(json=list[Item], stream=True)
+    async def handler(_, body):
+        return json([item.name async for item in body])
+
+    _, response = app.test_client.post(
+        "/items", content=b'[{"name": "a", "count": 1},'
+    )
+    assert response.status == 400
+    assert response.json["message"] == "Failed when parsing body as json"
+
+
+def test_validate_stream_requires_json_model():
+    with pytest.raises(InitError):
+        validate(form=_dataclass_item(), stream=True)
+
+
+@pytest.mark.parametrize(
+    "chunks,expected",
+    (
+        ([b"[]"], []),
+        ([b" [ 1 , 2 ] "], [b"1", b"2"]),
+        ([b'[{"a": [1, 2]}, "x,]"]'], [b'{"a": [1, 2]}', b'"x,]"']),
+        ([b'["a\\', b'"b", 1', b"]"], [b'"a\\"b"', b"1"]),
+        ([b"[1", b"2, 3", b"]"], [b"12", b"3"]),
+    ),
+)
+def test_json_array_splitter(chunks, expected):
+    splitter = JSONArraySplitter()
+    items = [item for chunk in chunks for item in splitter.feed(chunk)]
+    items.extend(splitter.close())
+    assert items == expected
+
+
+@pytest.mark.parametrize(
+    "body", (b"{}", b"[1,]", b"[,1]", b"[1] 2", b"[1", b"[1}")
+)
+def test_json_array_splitter_rejects_malformed(body):
+    splitter = JSONArraySplitter()
+    with pytest.raises(MalformedJSON):
+        splitter.feed(body)
+        splitter.close()
+
+
+@pytest.mark.parametrize(
+    "chunks,expected",
+    (
+        ([b"1\n\n 2 \n3"], [b"1", b"2", b"3"]),
+        ([b'{"a":', b" 1}\n", b"\n[2", b"]"], [b'{"a": 1}', b"[2]"]),
+        (
+            [bytes([c]) for c in b'{"a": 1}\n{"b": 2}\n'],
+            [b'{"a": 1}', b'{"b": 2}'],
+        ),
+    ),
+)
+def test_ndjson_splitter(chunks, expected):
+    splitter = NDJSONSplitter()
+    items = [item for chunk in chunks for item in splitter.feed(chunk)]
+    items.extend(splitter.close())
+    assert items == expected
+
+
+@pytest.mark.parametrize("splitter", (NDJSONSplitter, JSONArraySplitter))
+def test_splitter_item_size_limit(splitter):
+    splitter = splitter(max_size=8)
+    splitter.feed(b'[\n"1234"\n,\n')
+    with pytest.raises(PayloadTooLarge):
+        for _ in range(3):
+            splitter.feed(b'"12345"')